@@ -1,6 +1,30 @@
+from argparse import ArgumentParser
+
+import src.assets.definitions as df
+from src.frame_profiler import frame_profiler
 from src.game import Game
+from src.handler_timings import HandlerTimings
 
 
 if __name__ == "__main__":
-    game = Game()
+    parser = ArgumentParser(description="Play Wordle")
+    parser.add_argument("--time-handlers", action="store_true",
+                        help=f"time every event handler, written to {df.handler_timings} on exit or F12")
+    parser.add_argument("--handler-budget", type=float, default=df.HandlerBudget,
+                        help="milliseconds a handler call may take before it is reported (default: %(default)s)")
+    parser.add_argument("--profile-frames", metavar="PATH",
+                        help="write the time of every section of every frame to PATH (.csv, otherwise JSON lines)")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="show frame section p50/p95/p99 in the top left corner")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the order answers are dealt in")
+    arguments = parser.parse_args()
+
+    game = Game(arguments.seed)
+
+    if arguments.time_handlers:
+        game.event_manager.enable_timing(HandlerTimings(arguments.handler_budget))
+
+    if arguments.profile_frames or arguments.profile_overlay:
+        frame_profiler.enable(arguments.profile_frames, arguments.profile_overlay)
+
     game.run()
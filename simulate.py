@@ -0,0 +1,17 @@
+from argparse import ArgumentParser
+
+from src.simulator import Simulator
+from src.strategy import strategies
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Play complete games of Wordle with a guessing strategy")
+    parser.add_argument("games", type=int, help="number of games to play")
+    parser.add_argument("--strategy", choices=list(strategies), default="first")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the order answers are dealt in")
+    parser.add_argument("--matrix", action="store_true", help="use the cached feedback matrix")
+    arguments = parser.parse_args()
+
+    simulator = Simulator(arguments.strategy, arguments.workers, arguments.seed, arguments.matrix)
+    print(simulator.run(arguments.games).report())
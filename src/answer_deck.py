@@ -0,0 +1,87 @@
+from array import array
+from random import Random
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["AnswerDeck"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Answer Deck
+#
+class AnswerDeck:
+    """
+        Deals answers from a word list without repeats.
+
+        The deck is an array of word indices shuffled one step at a time (Fisher-Yates): each
+        draw swaps a random index from the undealt part of the deck to the cursor and deals it,
+        so every draw costs the same no matter how many words have been used.  Once every word
+        has been dealt the cursor returns to the start and a new pass begins.  The first draw of
+        a new pass never repeats the last word of the previous one.
+    """
+
+    def __init__(self, words, seed: int | None = None):
+        self.words = words
+        self.rng = Random(seed)
+        self.order = array("I", range(len(words)))
+        self.cursor = 0
+
+    # ---------------------------------------------------------------------------------------------
+    #   Remaining
+    #
+    @property
+    def remaining(self) -> int:
+        return len(self.order) - self.cursor
+
+    # ---------------------------------------------------------------------------------------------
+    #   Draw
+    #
+    def draw(self) -> str:
+        order = self.order
+        end = len(order)
+
+        if self.cursor == end:
+            self.cursor = 0
+            #
+            #   The last word dealt is still at the end of the deck, leave it out of this draw
+            #
+            if end > 1:
+                end -= 1
+
+        cursor = self.cursor
+        pick = self.rng.randrange(cursor, end)
+
+        order[cursor], order[pick] = order[pick], order[cursor]
+        self.cursor += 1
+
+        return self.words[order[cursor]]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Checkpoint
+    #
+    def checkpoint(self) -> dict:
+        """
+            Everything needed to carry on dealing from the same position.  Only plain lists and
+            ints are used so the checkpoint can be stored as JSON.
+        """
+        version, internal_state, gauss_next = self.rng.getstate()
+
+        return {
+            "cursor": self.cursor,
+            "order": self.order.tolist(),
+            "rng_state": [version, list(internal_state), gauss_next],
+        }
+
+    # ---------------------------------------------------------------------------------------------
+    #   Restore
+    #
+    def restore(self, checkpoint: dict):
+        if len(checkpoint["order"]) != len(self.words):
+            raise ValueError("Checkpoint was taken from a different word list")
+
+        version, internal_state, gauss_next = checkpoint["rng_state"]
+
+        self.order = array("I", checkpoint["order"])
+        self.cursor = checkpoint["cursor"]
+        self.rng.setstate((version, tuple(internal_state), gauss_next))
@@ -11,11 +11,67 @@ ScreenDimensions = (600,750)
 # -------------------------------------------------------------------------------------------------
 #   Images
 splash_screen_logo = "src/assets/wordle_splash_logo.png"
+SplashLogoSize = (400, 400)
+#
+# -------------------------------------------------------------------------------------------------
+#   Word List
+#
+#       Packed 5 bits per letter (see packed_words.py).  The data files below are relative to
+#       src/ and resolved by the modules that read them, so they load from any working directory
+#
+packed_words = "assets/wordle_words.bin"
+#
+# -------------------------------------------------------------------------------------------------
+#   Caches
+#
+#       Feedback pattern table built from wordle_words.all_words (see feedback.py)
+#
+feedback_cache = "wordle_patterns.bin"
+#
+#       Solver decision tree written by decision_tree.py
+#
+decision_tree = "wordle_tree.bin"
+#
+#       Solver opening guess and its second guess for every feedback (see solver.py)
+#
+opening_book = "wordle_opening.bin"
+#
+#       Images scaled to the size they are shown at (see image_cache.py)
+#
+image_cache = "image_cache"
 #
 # -------------------------------------------------------------------------------------------------
 #   Frame Rate
 #
 Fps = 60
+#
+#   Longest time in milliseconds the game sleeps waiting for input while nothing changes
+#
+MaxEventWait = 500
+#
+# -------------------------------------------------------------------------------------------------
+#   Profiling
+#
+#       Milliseconds a single event handler call may take before it is reported as slow
+#
+HandlerBudget = 1.0
+#
+#       Where handler timings are written, on exit or when TimingsDumpKey (F12) is pressed
+#
+handler_timings = "handler_timings.json"
+TimingsDumpKey = 1073741893
+#
+#       Width of the frame profiler overlay (see frame_profiler.py)
+#
+ProfilerOverlayWidth = 250
+#
+#       Milliseconds importing src.state_manager may take, all imports included (see
+#       tests/test_import_time.py).  Measured with that test's import_time, best of 3, median
+#       of 14 such runs on Python 3.11.7 with one CPU: 107 ms, and 174 ms the same way before
+#       the states were built lazily
+#
+ImportTimeBudget = 200
+#
 main_font = "src/assets/fonts/MonaspiceRnNerdFont-Regular.otf"
 splash_font = "src/assets/fonts/BigBlueTerm437NerdFont-Regular.ttf"
 # -------------------------------------------------------------------------------------------------
@@ -68,11 +124,16 @@ InvalidChosenKeyColor = (58, 58, 60)
 ValidCorrectPosColor = (83, 141, 78)
 ValidIncorrectPosColor = (181, 159, 59)
 InvalidPosColor = (58, 58, 60)
+#
+#   Frame Profiler Overlay
+#
+ProfilerOverlayColor = (0, 0, 0)
 # -------------------------------------------------------------------------------------------------
 # Font Sizes
 #
 BoardFontSize = 22
 KeyboardFontSize = 18
+ProfilerFontSize = 12
 RetDelKeyFontSize = 14
 GameButtonFontSize = 16
 # -------------------------------------------------------------------------------------------------
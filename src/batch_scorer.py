@@ -0,0 +1,137 @@
+from time import perf_counter
+
+import numpy as np
+
+import src.assets.definitions as df
+from src.feedback import PatternBase
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["encode_words", "score_arrays", "score_guess", "score_answer", "score_matrix"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Base-3 place values, same encoding as feedback.py
+#
+_powers = PatternBase ** np.arange(df.MaxLetters, dtype=np.int32)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Encode Words
+#
+def encode_words(words) -> np.ndarray:
+    """
+        Returns an (N, 5) uint8 array with one letter code (a = 0 ... z = 25) per position
+    """
+    joined = "".join(words).lower().encode("ascii")
+    letters = np.frombuffer(joined, dtype=np.uint8).reshape(-1, df.MaxLetters)
+
+    return letters - ord("a")
+
+
+# -------------------------------------------------------------------------------------------------
+#   Score Arrays
+#
+def score_arrays(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+        Scores encoded guesses against encoded answers, broadcasting over every axis but the
+        last, and returns the base-3 patterns as uint8.
+
+        Duplicate letters follow WordManager.get_flags: correct positions are taken first, then a
+        letter in the wrong position is marked only while the answer still has an unclaimed copy
+        of it, claimed from left to right.
+    """
+    guesses, answers = np.broadcast_arrays(guesses, answers)
+    correct = guesses == answers
+    unclaimed = ~correct
+
+    patterns = correct @ (2 * _powers)
+
+    for pos in range(df.MaxLetters):
+        letter = guesses[..., pos:pos + 1]
+        #
+        #   Copies of the letter left in the answer after the correct positions are removed, and
+        #   how many of those the same letter earlier in the guess has already claimed
+        #
+        available = ((answers == letter) & unclaimed).sum(axis=-1)
+        claimed = ((guesses[..., :pos] == letter) & unclaimed[..., :pos]).sum(axis=-1)
+
+        patterns += (unclaimed[..., pos] & (claimed < available)) * _powers[pos]
+
+    return patterns.astype(np.uint8)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Score Guess
+#
+def score_guess(guess: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+        One encoded guess, shape (5,), against every answer, shape (N, 5)
+    """
+    return score_arrays(guess[np.newaxis, :], answers)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Score Answer
+#
+def score_answer(guesses: np.ndarray, answer: np.ndarray) -> np.ndarray:
+    """
+        Every guess, shape (N, 5), against one encoded answer, shape (5,)
+    """
+    return score_arrays(guesses, answer[np.newaxis, :])
+
+
+# -------------------------------------------------------------------------------------------------
+#   Score Matrix
+#
+def score_matrix(words: np.ndarray, rows_per_chunk: int = 128) -> np.ndarray:
+    """
+        Full (N, N) guess x answer table.  Rows are scored in chunks to keep the temporary
+        (rows, N, 5) arrays small.
+    """
+    size = len(words)
+    patterns = np.empty((size, size), dtype=np.uint8)
+
+    for start in range(0, size, rows_per_chunk):
+        stop = min(start + rows_per_chunk, size)
+        patterns[start:stop] = score_arrays(words[start:stop, np.newaxis, :], words[np.newaxis, :, :])
+
+    return patterns
+
+
+# -------------------------------------------------------------------------------------------------
+#   Benchmark
+#
+def benchmark(guess: str = "crane"):
+    """
+        Scores one guess against all_words with score_guess and with a loop over
+        WordleEngine.get_flags, then prints both timings.
+    """
+    from src.engine import WordleEngine
+    from src.feedback import encode_flags
+    import src.wordle_words as words
+
+    encoded = encode_words(words.all_words)
+
+    start = perf_counter()
+    batch = score_guess(encode_words([guess])[0], encoded)
+    batch_time = perf_counter() - start
+
+    engine = WordleEngine()
+    letters = list(guess.upper())
+    answers = [answer.upper() for answer in words.all_words]
+
+    start = perf_counter()
+    looped = [encode_flags(engine.get_flags(letters, answer)) for answer in answers]
+    loop_time = perf_counter() - start
+
+    assert batch.tolist() == looped
+
+    print(f"{len(encoded)} answers")
+    print(f"get_flags loop : {loop_time * 1000:8.2f} ms")
+    print(f"score_guess    : {batch_time * 1000:8.2f} ms ({loop_time / batch_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,6 +1,7 @@
-from copy import deepcopy
-from src.rectangle import Rectangle, RectangleBuilder
-from src.text import Text, TextBuilder
+from src.dirty_regions import dirty_regions
+from src.prototype import compile_template
+from src.rectangle import Rectangle
+from src.text import Text
 import src.assets.definitions as df
 import src.assets.templates as tpl
 
@@ -9,6 +10,12 @@ import src.assets.templates as tpl
 #
 __all__ = ["Board"]
 
+# -------------------------------------------------------------------------------------------------
+#   Compiled templates
+#
+board_tile = compile_template(Rectangle.create, tpl.board_template)
+guess_tile = compile_template(Rectangle.create, tpl.board_guess_tile_template)
+
 
 # -------------------------------------------------------------------------------------------------
 #   Board CLass
@@ -16,20 +23,36 @@ __all__ = ["Board"]
 #       Responsible for creating and managing the 6x5 Wordle game board
 #
 class Board:
+    #
+    #   Flag --> guess tile color
+    #
+    guess_colors = {
+        df.InvalidPos: df.InvalidPosColor,
+        df.ValidIncorrectPos: df.ValidIncorrectPosColor,
+        df.ValidCorrectPos: df.ValidCorrectPosColor
+    }
+
     def __init__(self):
         self.tiles: list[Rectangle] = []
+        #
+        #   One colored tile per board tile, created by build.  A guess only recolors its row,
+        #   the first guess_count tiles are the ones on screen
+        #
         self.guess_tiles: list[Rectangle] = []
+        self.guess_count = 0
         self.renderable_letters: list[Text] = []
         self.row_index = 0
-
-        self.rect_builder = RectangleBuilder()
-        self.text_builder = TextBuilder()
+        #
+        #   Position, color and thickness of every tile, set by build and used as the key of
+        #   the static background layer
+        #
+        self.layout: tuple = ()
 
     # -------------------------------------------------------------------------------------------------
     #   New Game
     #
     def new_game(self):
-        self.guess_tiles.clear()
+        self.guess_count = 0
         self.renderable_letters.clear()
         self.row_index = 0
 
@@ -37,19 +60,32 @@ class Board:
     #   Build
     #
     def build(self):
+        """
+            Builds the tiles once, later calls keep them (see StateManager, the board may be
+            built in the background before Play is pressed)
+        """
+        if self.tiles:
+            return
+
         index = 0
         for row in range(df.BoardRows):
             for col in range(df.BoardCols):
-                rectangle = deepcopy(tpl.board_template)
                 x_coord = df.BoardBaseX + (df.BoardRectangleWidth + df.BoardGap) * col
                 y_coord = df.BoardBaseY + (df.BoardHeight + df.BoardGap) * row
 
-                rectangle['x_coord'] = x_coord
-                rectangle['y_coord'] = y_coord
-                rectangle["index"] = index
-
+                self.tiles.append(board_tile.clone(x_coord=x_coord, y_coord=y_coord, index=index))
                 index += 1
-                self.tiles.append(self.rect_builder.build(rectangle))
+
+        for index, tile in enumerate(self.tiles):
+            self.guess_tiles.append(
+                guess_tile.clone(
+                    x_coord=tile.x_coord + 2 * tile.thickness,
+                    y_coord=tile.y_coord + 2 * tile.thickness,
+                    index=index
+                )
+            )
+
+        self.layout = tuple((*tile.rectangle, tile.color, tile.thickness) for tile in self.tiles)
 
     # ---------------------------------------------------------------------------------------------
     #   Update Board
@@ -59,26 +95,15 @@ class Board:
             The index of each flag directly corresponds to a box on the Wordle board and is colored
             according to the rules of the game.
 
-            Deepcopy is used to prevent overwriting the dictionary template used for all tiles
+            The guess tiles already exist (see build), only their color is set here
         """
-        temp_tile = deepcopy(tpl.board_guess_tile_template)
-
-        for index, flag in enumerate(flags):
-            rect_index = 5 * self.row_index + index
-
-            if flag == df.InvalidPos:
-                temp_tile['color'] = df.InvalidPosColor
-
-            if flag == df.ValidIncorrectPos:
-                temp_tile['color'] = df.ValidIncorrectPosColor
+        row_start = df.BoardCols * self.row_index
 
-            if flag == df.ValidCorrectPos:
-                temp_tile['color'] = df.ValidCorrectPosColor
-            #
-            #
-            temp_tile['x_coord'] = self.tiles[rect_index].x_coord + 2 * self.tiles[rect_index].thickness
-            temp_tile['y_coord'] = self.tiles[rect_index].y_coord + 2 * self.tiles[rect_index].thickness
+        for index in range(len(flags)):
+            rect_index = row_start + index
 
-            self.guess_tiles.append(self.rect_builder.build(temp_tile))
+            self.guess_tiles[rect_index].color = self.guess_colors[flags[index]]
+            dirty_regions.mark(self.tiles[rect_index].rectangle)
 
         self.row_index += 1
+        self.guess_count = row_start + len(flags)
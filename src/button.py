@@ -1,8 +1,10 @@
-from copy import deepcopy
+from src.dirty_regions import dirty_regions
+from src.fonts import FontRegistry, GlyphAtlas
+from src.prototype import compile_template
 import src.assets.templates as tpl
 import pygame as pg
 
-__all__ = ["Button"]
+__all__ = ["Button", "NavButtonManager", "nav_button"]
 
 
 # -------------------------------------------------------------------------------------------------
@@ -46,6 +48,46 @@ class Button:
         for k, v in template.items():
             if hasattr(self, k):
                 setattr(self, k, v)
+
+        self.compute()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Create
+    #
+    #       Builds a button straight from its values, used by compiled templates (see
+    #       prototype.py)
+    #
+    @classmethod
+    def create(cls, x=None, y=None, w=None, h=None, button_color=None, button_thickness=None,
+               button_curve=None, border_color=None, border_thickness=None, border_curve=None,
+               label=None, font=None, font_path=None, font_size=None, font_color=None, antialias=None):
+        button = cls()
+        button.x = x
+        button.y = y
+        button.w = w
+        button.h = h
+        button.button_color = button_color
+        button.button_thickness = button_thickness
+        button.button_curve = button_curve
+        button.border_color = border_color
+        button.border_thickness = border_thickness
+        button.border_curve = border_curve
+        button.label = label
+        button.font = font
+        button.font_path = font_path
+        button.font_size = font_size
+        button.font_color = font_color
+        button.antialias = antialias
+        button.compute()
+
+        return button
+
+    # ---------------------------------------------------------------------------------------------
+    #   Compute
+    #
+    #       Rectangles and the rendered label, from the values set by build or create
+    #
+    def compute(self):
         # -----------------------------------------------------------------------------------------
         # BUTTON
         self.button_rectangle = pg.Rect(self.x, self.y, self.w, self.h)
@@ -59,10 +101,12 @@ class Button:
                 self.h + 2 * self.border_thickness
             )
         # -----------------------------------------------------------------------------------------
-        # FONT OBJECT
+        # FONT OBJECT AND RENDERABLE OBJECT
         try:
-            pg.font.init()
-            self.font_object = pg.font.Font(self.font_path, self.font_size)
+            self.font_object = FontRegistry.get(self.font_path, self.font_size)
+            self.renderable_font = GlyphAtlas.get(
+                self.label, self.font_path, self.font_size, self.antialias, self.font_color
+            )
         except FileNotFoundError:
             try:
                 self.font_object = pg.font.SysFont(self.font_path, self.font_size)
@@ -70,24 +114,50 @@ class Button:
                 pass
             else:
                 self.font_object = pg.font.Font(None, self.font_size)
-        # -----------------------------------------------------------------------------------------
-        # RENDERABLE OBJECT
-        self.renderable_font = self.font_object.render(self.label, self.antialias, self.font_color)
+
+            self.renderable_font = self.font_object.render(self.label, self.antialias, self.font_color)
         # -----------------------------------------------------------------------------------------
         # FONT RECTANGLE
         self.font_rectangle = self.renderable_font.get_rect(center=self.button_rectangle.center)
 
+    # -------------------------------------------------------------------------------------------------
+    #   Set Button Color
+    #
+    #       Only marks the button for redrawing when the color actually changes
+    #
+    def set_button_color(self, color):
+        if self.button_color != color:
+            self.button_color = color
+            dirty_regions.mark(self.border_rectangle or self.button_rectangle)
+
     # -------------------------------------------------------------------------------------------------
     #   Draw a button
     #
     def draw(self, canvas):
+        self.draw_border(canvas)
+        self.draw_face(canvas)
+
+    # -------------------------------------------------------------------------------------------------
+    #   Border only, drawn once into the static layer in the Play state
+    #
+    def draw_border(self, canvas):
         if self.border_color:
             pg.draw.rect(canvas, self.border_color, self.border_rectangle, self.border_thickness, self.border_curve)
 
+    # -------------------------------------------------------------------------------------------------
+    #   Button color and label, the part that changes on mouse over
+    #
+    def draw_face(self, canvas):
         pg.draw.rect(canvas, self.button_color, self.button_rectangle, self.button_thickness, self.button_curve)
         canvas.blit(self.renderable_font, self.font_rectangle)
 
 
+# -------------------------------------------------------------------------------------------------
+#   Compiled game_button_template, shared by the states and the Nav Button Manager
+#
+nav_button = compile_template(Button.create, tpl.game_button_template)
+
+
 # -------------------------------------------------------------------------------------------------
 #   Nav Button Manager
 #
@@ -101,11 +171,9 @@ class NavButtonManager:
     #   Generate all the navigation buttons used throughout the game
     #
     def generate(self):
+        """
+            The buttons keep the template's empty label, as they always have: the old builder
+            was handed the name under a 'text' key that Button does not have
+        """
         for name, coords in tpl.game_button_name_and_coords.items():
-            tmp = Button()
-            template = deepcopy(tpl.game_button_template)
-            template['x'] = coords[0]
-            template['y'] = coords[1]
-            template['text'] = name
-            tmp.build(template)
-            self.game_buttons[name] = tmp
+            self.game_buttons[name] = nav_button.clone(x=coords[0], y=coords[1])
@@ -0,0 +1,231 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+import os
+import struct
+import sys
+
+from src.engine import WordleEngine
+from src.feedback import AllCorrectPattern, FeedbackMatrix, encode_flags, words_digest
+from src.solver import EntropySolver
+
+import src.assets.definitions as df
+import src.wordle_words as words
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["DecisionTree", "build_tree"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   File Layout
+#
+#       Header: magic (4 bytes) | version (uint16) | word count (uint32) | sha256 of the word list
+#               | root offset (uint32) | node count (uint32)
+#
+#       Node:   guess index (uint16) | child count (uint8) | child patterns (uint8 * count)
+#               | child offsets (uint32 * count)
+#
+#       Only the feedback patterns that can actually happen get a child, sorted by pattern, and
+#       offsets are from the start of the file.  A node without children is a leaf: its guess is
+#       the answer.
+#
+TreeMagic = b"WTRE"
+TreeVersion = 1
+TreeHeader = struct.Struct("<4sHI32sII")
+NodeHeader = struct.Struct("<HB")
+TreePath = str(Path(__file__).resolve().parent / df.decision_tree)
+
+# -------------------------------------------------------------------------------------------------
+#   Per-process solver, created once by the pool initializer
+#
+_solver: EntropySolver | None = None
+
+
+# -------------------------------------------------------------------------------------------------
+#   Start Worker
+#
+def _start_worker():
+    global _solver
+    _solver = EntropySolver(FeedbackMatrix.load(words.all_words))
+
+
+# -------------------------------------------------------------------------------------------------
+#   Build Subtree
+#
+def _build_subtree(candidates: list[int], solver: EntropySolver | None = None) -> tuple:
+    """
+        Returns (guess index, {pattern: child}) for the solver's choice over <candidates>
+    """
+    solver = solver or _solver
+    solver.candidates = array("I", candidates)
+
+    guess = solver.matrix.index_of(solver.next_guess())
+    row = solver.matrix.row(guess)
+
+    buckets: dict[int, list[int]] = {}
+    for index in candidates:
+        buckets.setdefault(row[index], []).append(index)
+
+    buckets.pop(AllCorrectPattern, None)
+
+    return guess, {pattern: _build_subtree(bucket, solver) for pattern, bucket in sorted(buckets.items())}
+
+
+# -------------------------------------------------------------------------------------------------
+#   Build Tree
+#
+def build_tree(path: str = TreePath, workers: int | None = None) -> int:
+    """
+        Works out the solver's full decision tree over all_words and writes it to <path>.  The
+        opening guess is chosen here and each of its feedback buckets is built in a worker
+        process.  Returns the number of nodes written.
+    """
+    matrix = FeedbackMatrix.load(words.all_words)
+    solver = EntropySolver(matrix)
+
+    root_guess = matrix.index_of(solver.next_guess())
+    row = matrix.row(root_guess)
+
+    buckets: dict[int, list[int]] = {}
+    for index in range(matrix.size):
+        buckets.setdefault(row[index], []).append(index)
+
+    buckets.pop(AllCorrectPattern, None)
+    patterns = sorted(buckets)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker) as pool:
+        children = list(pool.map(_build_subtree, [buckets[pattern] for pattern in patterns]))
+
+    return _write_tree((root_guess, dict(zip(patterns, children))), matrix, path)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Write Tree
+#
+def _write_tree(root: tuple, matrix: FeedbackMatrix, path: str) -> int:
+    nodes = bytearray()
+    node_count = 0
+
+    def write_node(node) -> int:
+        """
+            Children are written before their parent so the parent knows their offsets
+        """
+        nonlocal node_count
+        guess, children = node
+        child_offsets = array("I", (write_node(child) for child in children.values()))
+
+        if sys.byteorder == "big":
+            child_offsets.byteswap()
+
+        offset = TreeHeader.size + len(nodes)
+        nodes.extend(NodeHeader.pack(guess, len(children)))
+        nodes.extend(bytes(children))
+        nodes.extend(child_offsets.tobytes())
+        node_count += 1
+
+        return offset
+
+    root_offset = write_node(root)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temp_path, "wb") as tree:
+        tree.write(TreeHeader.pack(
+            TreeMagic, TreeVersion, matrix.size, words_digest(matrix.words), root_offset, node_count
+        ))
+        tree.write(nodes)
+
+    os.replace(temp_path, path)
+    return node_count
+
+
+# -------------------------------------------------------------------------------------------------
+#   Decision Tree
+#
+class DecisionTree:
+    """
+        Read-only view of a tree written by build_tree.  A hint is a walk from the root along
+        the feedback of the guesses made so far, one step per guess.
+    """
+
+    def __init__(self, data: bytes, word_list=words.all_words):
+        self.data = data
+        self.word_list = word_list
+
+        magic, version, size, digest, self.root, self.node_count = TreeHeader.unpack_from(data)
+        if (magic, version, size) != (TreeMagic, TreeVersion, len(word_list)):
+            raise ValueError("Decision tree was written for a different version or word list")
+
+        if digest != words_digest(word_list):
+            raise ValueError("Decision tree was written for a different word list")
+
+    # ---------------------------------------------------------------------------------------------
+    #   Load
+    #
+    @classmethod
+    def load(cls, path: str = TreePath, word_list=words.all_words):
+        with open(path, "rb") as tree:
+            return cls(tree.read(), word_list)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Guess At
+    #
+    def guess_at(self, offset: int) -> str:
+        guess, _ = NodeHeader.unpack_from(self.data, offset)
+        return self.word_list[guess]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Child
+    #
+    def child(self, offset: int, pattern: int) -> int | None:
+        """
+            Offset of the node reached from <offset> with feedback <pattern>, binary searched over
+            the node's sorted child patterns
+        """
+        _, count = NodeHeader.unpack_from(self.data, offset)
+        patterns_start = offset + NodeHeader.size
+        low, high = 0, count
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.data[patterns_start + middle] < pattern:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == count or self.data[patterns_start + low] != pattern:
+            return None
+
+        (child_offset,) = struct.unpack_from("<I", self.data, patterns_start + count + 4 * low)
+        return child_offset
+
+    # ---------------------------------------------------------------------------------------------
+    #   Hint
+    #
+    def hint(self, engine: WordleEngine) -> str | None:
+        """
+            Next guess for the engine's game so far, or None once the player has left the tree by
+            making a guess the tree would not have made
+        """
+        offset = self.root
+
+        for guess, flags in zip(engine.guesses, engine.feedback):
+            if guess.lower() != self.guess_at(offset):
+                return None
+
+            offset = self.child(offset, encode_flags(flags))
+            if offset is None:
+                return None
+
+        return self.guess_at(offset)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Builds the tree, python -m src.decision_tree
+#
+if __name__ == "__main__":
+    start = perf_counter()
+    count = build_tree()
+    print(f"{count} nodes written to {TreePath} in {perf_counter() - start:.1f} s")
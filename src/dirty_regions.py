@@ -0,0 +1,77 @@
+import pygame as pg
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["DirtyRegions", "dirty_regions"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Dirty Regions
+#
+#       Anything that changes what is on screen marks the area it changed.  Game.run only redraws
+#       and updates the display when something has been marked, and then only those areas.
+#
+#       Marking does not allocate: the marked Rect itself is stored (the tile's or key's own
+#       rectangle, which must not move before the next take) and the slots of the list are
+#       reused from frame to frame, count says how many of them belong to the current frame.
+#
+class DirtyRegions:
+    def __init__(self):
+        self.rects: list[pg.Rect] = []
+        self.count = 0
+        #
+        #   Set until the first frame and after every state transition
+        #
+        self.everything = True
+
+    # ---------------------------------------------------------------------------------------------
+    #   Is Dirty
+    #
+    @property
+    def is_dirty(self) -> bool:
+        return self.everything or self.count > 0
+
+    # ---------------------------------------------------------------------------------------------
+    #   Mark
+    #
+    def mark(self, rect: pg.Rect):
+        if self.everything:
+            return
+
+        if self.count < len(self.rects):
+            self.rects[self.count] = rect
+        else:
+            self.rects.append(rect)
+
+        self.count += 1
+
+    # ---------------------------------------------------------------------------------------------
+    #   Mark All
+    #
+    def mark_all(self):
+        self.everything = True
+        self.count = 0
+
+    # ---------------------------------------------------------------------------------------------
+    #   Take
+    #
+    def take(self, screen_rect: pg.Rect) -> list[pg.Rect]:
+        """
+            Returns the regions to redraw this frame and starts collecting the next frame's
+        """
+        if self.everything:
+            rects = [pg.Rect(screen_rect)]
+        else:
+            rects = self.rects[:self.count]
+
+        self.count = 0
+        self.everything = False
+
+        return rects
+
+
+# -------------------------------------------------------------------------------------------------
+#   Shared by every view object
+#
+dirty_regions = DirtyRegions()
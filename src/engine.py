@@ -0,0 +1,179 @@
+from src.answer_deck import AnswerDeck
+from src.feedback import FeedbackMatrix
+
+import src.assets.definitions as df
+import src.wordle_words as words
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["WordleEngine"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Wordle Engine
+#
+class WordleEngine:
+    """
+        Pure game logic with no pygame dependency: the answer, the letters of the guess being
+        typed, the submitted guesses with their flags and the win/lose state.
+
+        WordManager wraps an engine for the pygame game, simulations and solvers drive one
+        directly.  Letters and words are kept in upper case like the rest of the game.
+    """
+
+    def __init__(
+            self,
+            answer_deck: AnswerDeck | None = None,
+            feedback_matrix: FeedbackMatrix | None = None,
+            word_list=words.all_words
+    ):
+        self.word_list = word_list
+        self.answer_deck = answer_deck if answer_deck is not None else AnswerDeck(word_list)
+        # -----------------------------------------------------------------------------------------
+        #   Optional precomputed feedback table, get_flags falls back to scoring the guess itself
+        #   when there is no table or the guess is not in it
+        #
+        self.feedback_matrix = feedback_matrix
+
+        self.answer = None
+        self.letters: list[str] = []
+        self.guesses: list[str] = []
+        self.feedback: list[list[int]] = []
+        self.won = False
+
+    # ---------------------------------------------------------------------------------------------
+    #   Properties
+    #
+    @property
+    def lost(self) -> bool:
+        return not self.won and len(self.guesses) == df.BoardRows
+
+    @property
+    def game_over(self) -> bool:
+        return self.won or len(self.guesses) == df.BoardRows
+
+    # ---------------------------------------------------------------------------------------------
+    #   New Game
+    #
+    def new_game(self, answer: str | None = None):
+        """
+            Clears the letters, guesses and flags and sets a new answer
+        """
+        self.set_answer(answer)
+        self.letters.clear()
+        self.guesses.clear()
+        self.feedback.clear()
+        self.won = False
+
+    # ---------------------------------------------------------------------------------------------
+    #   Set Answer
+    #
+    def set_answer(self, answer: str | None = None):
+        """
+            Uses <answer> when given, otherwise deals the next word from the answer deck
+        """
+        if answer is None:
+            answer = self.answer_deck.draw()
+
+        self.answer = answer.upper()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Add Letter
+    #
+    def add_letter(self, letter: str) -> bool:
+        if self.game_over or len(self.letters) == df.MaxLetters:
+            return False
+
+        self.letters.append(letter.upper())
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+    #   Remove Letter
+    #
+    def remove_letter(self) -> bool:
+        if self.game_over or not self.letters:
+            return False
+
+        self.letters.pop()
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+    #   Is Valid Word
+    #
+    def is_valid_word(self, word: str) -> bool:
+        return word in self.word_list
+
+    # ---------------------------------------------------------------------------------------------
+    #   Submit
+    #
+    def submit(self) -> list[int] | None:
+        """
+            Scores the typed letters against the answer.  Returns None and changes nothing when the
+            game is over, fewer than 5 letters have been typed or the word is not in the word list.
+        """
+        if self.game_over or len(self.letters) != df.MaxLetters:
+            return None
+
+        guess = "".join(self.letters)
+        if not self.is_valid_word(guess):
+            return None
+
+        flags = self.get_flags(guess, self.answer)
+
+        self.guesses.append(guess)
+        self.feedback.append(flags)
+        self.letters.clear()
+        self.won = all(flag == df.ValidCorrectPos for flag in flags)
+
+        return flags
+
+    # ---------------------------------------------------------------------------------------------
+    #   Play
+    #
+    def play(self, word: str) -> list[int] | None:
+        """
+            Types and submits a whole word, replacing any letters typed so far
+        """
+        if self.game_over:
+            return None
+
+        self.letters[:] = word.upper()
+        return self.submit()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Find Occurrences
+    #
+    @staticmethod
+    def find_occurrences(char: str, word: list[str]) -> list[int]:
+        return [index for (index, char_in_word) in enumerate(word) if char == char_in_word]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Get Flags
+    #
+    def get_flags(self, guess: str | list[str], answer: str) -> list[int]:
+        if self.feedback_matrix is not None:
+            flags = self.feedback_matrix.get_flags(guess, answer)
+            if flags is not None:
+                return flags
+
+        found = []
+        flags = [df.InvalidPos, df.InvalidPos, df.InvalidPos, df.InvalidPos, df.InvalidPos,]
+        w_word = list(answer)
+
+        for index, (char_in_guess, char_in_word) in enumerate(zip(guess, w_word)):
+            if char_in_guess == char_in_word:
+                flags[index] = df.ValidCorrectPos
+                found.append(index)
+
+        for index, char in enumerate(guess):
+            if char in w_word and flags[index] != df.ValidCorrectPos:
+                occurrences = self.find_occurrences(char, w_word)
+
+                for pos in occurrences:
+                    if pos not in found:
+                        flags[index] = df.ValidIncorrectPos
+                        found.append(pos)
+                        break
+
+        return flags
@@ -85,16 +85,13 @@ class GameKeypadMouseUpHandler(Handler):
         #
         #   Command --> WordManager.add_letter
         #
-        for key in self.keyboard.keypad:
-            if key.rectangle.collidepoint(args[Index.MousePos]):
-                #
-                # Exclude the case of clicking the Return or Delete keys
-                if not(self.keyboard.letters[key.index].label == "Return" or self.keyboard.letters[key.index].label == "Delete"):
-                    self.add_letter_command.execute(
-                        self.keyboard.get_letter(
-                            self.keyboard.keypad.index(key)
-                        )
-                    )
+        index = self.keyboard.key_at(args[Index.MousePos])
+
+        if index is not None:
+            #
+            # Exclude the case of clicking the Return or Delete keys
+            if not(self.keyboard.letters[index].label == "Return" or self.keyboard.letters[index].label == "Delete"):
+                self.add_letter_command.execute(self.keyboard.get_letter(index))
 
 
 # -------------------------------------------------------------------------------------------------
@@ -108,16 +105,21 @@ class GameKeypadMouseMotionHandler(Handler):
     #
     def handle_it(self, *args):
         """
-            Iterate over keyboard buttons checking for collision and, while a collision
-            exists, change the buttons background color
+            Look up the key under the mouse and, when it is a different key than before,
+            restore the previous key's background color and highlight the new one
 
                 *args = current mouse pos
         """
-        for key in self.keyboard.keypad:
-            if key.rectangle.collidepoint(args[Index.MousePos]):
-                key.color = df.ButtonMouseOverColor
-            else:
-                self.keyboard.update_key(key)
+        index = self.keyboard.key_at(args[Index.MousePos])
+
+        if index != self.keyboard.hovered:
+            if self.keyboard.hovered is not None:
+                self.keyboard.update_key(self.keyboard.keypad[self.keyboard.hovered])
+
+            if index is not None:
+                self.keyboard.set_key_color(self.keyboard.keypad[index], df.ButtonMouseOverColor)
+
+            self.keyboard.hovered = index
 
 
 # -------------------------------------------------------------------------------------------------
@@ -134,10 +136,10 @@ class GameKeypadReturnHandler(Handler):
     # ---------------------------------------------------------------------------------------------
     #
     def handle_it(self, *args):
-        for key in self.keyboard.keypad:
-            if key.rectangle.collidepoint(args[Index.MousePos]):
-                if self.keyboard.letters[key.index].label == "Return":
-                    self.validate_word_command.execute(*args)
+        index = self.keyboard.key_at(args[Index.MousePos])
+
+        if index is not None and self.keyboard.letters[index].label == "Return":
+            self.validate_word_command.execute(*args)
 
 
 # -------------------------------------------------------------------------------------------------
@@ -154,10 +156,10 @@ class GameKeypadBackspaceHandler(Handler):
     #----------------------------------------------------------------------------------------------
     #
     def handle_it(self, *args):
-        for key in self.keyboard.keypad:
-            if key.rectangle.collidepoint(args[Index.MousePos]):
-                if self.keyboard.letters[key.index].label == "Delete":
-                    self.backspace_command.execute(*args)
+        index = self.keyboard.key_at(args[Index.MousePos])
+
+        if index is not None and self.keyboard.letters[index].label == "Delete":
+            self.backspace_command.execute(*args)
 
 
 # -------------------------------------------------------------------------------------------------
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections import Counter
+from time import perf_counter_ns
+from src.dirty_regions import dirty_regions
 import src.assets.definitions as df
 import pygame as pg
+import atexit
 import sys
 
 # -------------------------------------------------------------------------------------------------
@@ -25,7 +29,28 @@ class EventListener(ABC):
 class EventManager:
 
     def __init__(self):
+        #
+        #   event type --> tuple of handlers.  Replaced, never mutated, on (un)subscribe so a
+        #   handler may change the subscriptions while notify is walking them
+        #
         self.listeners = {}
+        #
+        #   scope --> [(event type, handler), ...] subscribed for that scope
+        #
+        self.scopes: dict[str, list[tuple]] = {}
+        #
+        #   Running totals kept by parse:
+        #
+        #       received    -> events taken from the queue
+        #       dispatched  -> notify calls made
+        #       merged      -> MOUSEMOTION events folded into another one in the same frame
+        #       dropped     -> events nothing listens to (unmapped keys, other event types)
+        #
+        self.counters = Counter()
+        #
+        #   HandlerTimings once enable_timing has been called
+        #
+        self.timings = None
 
     # ---------------------------------------------------------------------------------------------
     #   Register Events
@@ -39,22 +64,74 @@ class EventManager:
                 Alt_keymap      -> key/value K_RETURN, K_BACKSPACE, K_ESCAPE, K_MOUSEBUTTONUP, K_KEYDOWN
         """
         for event in df.alpha_keymap.values():
-            self.listeners[event]: dict = []
+            self.listeners[event]: tuple = ()
 
         for event in df.used_pygame_events.values():
-            self.listeners[event]: dict = []
+            self.listeners[event]: tuple = ()
 
     # ---------------------------------------------------------------------------------------------
     #   Subscribe
     #
-    def subscribe(self, event_type, handler):
-        self.listeners[event_type].append(handler)
+    def subscribe(self, event_type, handler, scope: str | None = None) -> bool:
+        """
+            Adds <handler> to the listeners of <event_type>.  Subscribing a handler that is
+            already listening to the event is refused (returns False), other handlers of the
+            same class are not duplicates.  Handlers subscribed with a <scope> are removed
+            together by release(scope)
+        """
+        listeners = self.listeners[event_type]
+
+        if handler in listeners:
+            return False
+
+        self.listeners[event_type] = (*listeners, handler)
+
+        if scope is not None:
+            self.scopes.setdefault(scope, []).append((event_type, handler))
+
+        return True
 
     # ---------------------------------------------------------------------------------------------
     #   Unsubscribe
     #
     def unsubscribe(self, event_type, handler):
-        self.listeners[event_type].remove(handler)
+        listeners = self.listeners[event_type]
+
+        if handler not in listeners:
+            raise ValueError(f"{handler!r} is not subscribed to event {event_type}")
+
+        self.listeners[event_type] = tuple(listener for listener in listeners if listener is not handler)
+
+        for subscriptions in self.scopes.values():
+            if (event_type, handler) in subscriptions:
+                subscriptions.remove((event_type, handler))
+
+    # ---------------------------------------------------------------------------------------------
+    #   Release
+    #
+    def release(self, scope: str):
+        """
+            Unsubscribes every handler that was subscribed with <scope>
+        """
+        for event_type, handler in self.scopes.pop(scope, []):
+            self.listeners[event_type] = tuple(
+                listener for listener in self.listeners[event_type] if listener is not handler
+            )
+
+    # ---------------------------------------------------------------------------------------------
+    #   Listener Count
+    #
+    def listener_count(self, event_type) -> int:
+        return len(self.listeners.get(event_type, ()))
+
+    # ---------------------------------------------------------------------------------------------
+    #   Active Listeners
+    #
+    def active_listeners(self) -> dict:
+        """
+            event type --> number of subscribed handlers, for every event with at least one
+        """
+        return {event_type: len(handlers) for event_type, handlers in self.listeners.items() if handlers}
 
     # ---------------------------------------------------------------------------------------------
     #   Notify
@@ -63,28 +140,79 @@ class EventManager:
         for handler in self.listeners[event_type]:
             handler.handle_it(*args)
 
+    # ---------------------------------------------------------------------------------------------
+    #   Enable Timing
+    #
+    def enable_timing(self, timings):
+        """
+            Times every handler call from now on.  notify is swapped for timed_notify on this
+            instance, so nothing is measured, and nothing costs anything, until this is called.
+            The timings are dumped on exit and whenever TimingsDumpKey is pressed
+        """
+        self.timings = timings
+        self.notify = self.timed_notify
+        atexit.register(timings.dump)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Timed Notify
+    #
+    def timed_notify(self, event_type, *args):
+        record = self.timings.record
+
+        for handler in self.listeners[event_type]:
+            start = perf_counter_ns()
+            handler.handle_it(*args)
+            record(event_type, handler, perf_counter_ns() - start)
+
     # ---------------------------------------------------------------------------------------------
     #   Parse
     #
-    def parse(self):
+    def parse(self, events: list | None = None):
         """
-        Parse the event loop and notify all respective listeners
+        Parse the event loop and notify all respective listeners.  Reads the pygame event
+        queue unless the events have already been taken from it (see FrameScheduler.wait)
+
+        Key presses and clicks are dispatched in order, one notify each.  Mouse motion is
+        coalesced: however many MOUSEMOTION events are queued, the motion listeners are
+        notified once per frame, with the latest mouse position.
         """
         mouse_pos = pg.mouse.get_pos()
 
-        for event in pg.event.get():
+        if events is None:
+            events = pg.event.get()
+
+        counters = self.counters
+        counters["received"] += len(events)
+        motions = 0
+
+        for event in events:
             if event.type == pg.KEYDOWN:
                 if event.key in df.alpha_keymap.values() or event.key in df.used_pygame_events.values():
                     self.notify(event.key, chr(event.key))
+                    counters["dispatched"] += 1
+                elif event.key == df.TimingsDumpKey and self.timings is not None:
+                    self.timings.dump()
                 else:
-                    pass
+                    counters["dropped"] += 1
 
-            if event.type == pg.MOUSEBUTTONUP:
+            elif event.type == pg.MOUSEBUTTONUP:
                 self.notify(pg.MOUSEBUTTONUP, mouse_pos)
+                counters["dispatched"] += 1
+
+            elif event.type == pg.MOUSEMOTION:
+                motions += 1
 
-            if event.type == pg.MOUSEMOTION:
-                self.notify(pg.MOUSEMOTION, mouse_pos)
+            elif event.type == pg.WINDOWEXPOSED:
+                dirty_regions.mark_all()
 
-            if event.type == pg.QUIT:
+            elif event.type == pg.QUIT:
                 pg.quit()
                 sys.exit()
+
+            else:
+                counters["dropped"] += 1
+
+        if motions:
+            self.notify(pg.MOUSEMOTION, mouse_pos)
+            counters["dispatched"] += 1
+            counters["merged"] += motions - 1
@@ -0,0 +1,252 @@
+from hashlib import sha256
+from pathlib import Path
+import mmap
+import os
+import struct
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["FeedbackMatrix", "score", "encode_flags", "decode_pattern"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Pattern Encoding
+#
+#       A set of five flags is stored as a single base-3 number so that every guess/answer pair
+#       fits in one byte.  The flag at position 0 is the least significant digit.
+#
+#           Invalid                     = -1 --> 0
+#           Valid Incorrect Position    = 0  --> 1
+#           Valid Correct Position      = 1  --> 2
+#
+PatternBase = 3
+PatternCount = PatternBase ** df.MaxLetters
+AllCorrectPattern = PatternCount - 1
+
+_powers = tuple(PatternBase ** pos for pos in range(df.MaxLetters))
+
+# -------------------------------------------------------------------------------------------------
+#   Cache File Layout
+#
+#       magic (4 bytes) | version (uint16) | word count (uint32) | sha256 of the word list
+#       followed by size * size pattern bytes in row major order
+#
+CacheMagic = b"WPAT"
+CacheVersion = 1
+CacheHeader = struct.Struct("<4sHI32s")
+CachePath = str(Path(__file__).resolve().parent / df.feedback_cache)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Encode Flags
+#
+def encode_flags(flags: list[int]) -> int:
+    return sum((flag - df.InvalidPos) * power for flag, power in zip(flags, _powers))
+
+
+# -------------------------------------------------------------------------------------------------
+#   Decode Pattern
+#
+def decode_pattern(pattern: int) -> list[int]:
+    flags = []
+
+    for _ in range(df.MaxLetters):
+        pattern, digit = divmod(pattern, PatternBase)
+        flags.append(digit + df.InvalidPos)
+
+    return flags
+
+
+# -------------------------------------------------------------------------------------------------
+#   Words Digest
+#
+def words_digest(words) -> bytes:
+    return sha256("\n".join(word.lower() for word in words).encode("ascii")).digest()
+
+
+# -------------------------------------------------------------------------------------------------
+#   Score
+#
+def score(guess: str, answer: str) -> int:
+    """
+        Same rules as WordManager.get_flags but returns the encoded pattern.  Correct positions are
+        found first and whatever is left of the answer is used up from left to right by the
+        letters in the wrong position.
+    """
+    pattern = 0
+    unmatched = []
+
+    for pos in range(df.MaxLetters):
+        if guess[pos] == answer[pos]:
+            pattern += 2 * _powers[pos]
+        else:
+            unmatched.append(answer[pos])
+
+    if unmatched:
+        for pos in range(df.MaxLetters):
+            char = guess[pos]
+            if char != answer[pos] and char in unmatched:
+                pattern += _powers[pos]
+                unmatched.remove(char)
+
+    return pattern
+
+
+# -------------------------------------------------------------------------------------------------
+#   Feedback Matrix
+#
+class FeedbackMatrix:
+    """
+        Precomputed guess x answer table of feedback patterns.
+
+        Row i holds the pattern for guessing words[i] against every word in the list, so the
+        pattern for (guess, answer) lives at patterns[guess_index * size + answer_index].  Words
+        are matched case-insensitively.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self.size = len(words)
+        self.indices: dict[str, int] = {word.lower(): index for index, word in enumerate(words)}
+        self.patterns = None
+        #
+        #   Kept open for as long as patterns points into it
+        #
+        self.mapped_file = None
+
+    # ---------------------------------------------------------------------------------------------
+    #   Load
+    #
+    @classmethod
+    def load(cls, words, path: str = CachePath):
+        """
+            Maps the cached table at <path> into memory, rebuilding and rewriting the cache first
+            when it is missing, from an older version or built from a different word list.
+            Every process that loads the same file shares its pages.
+        """
+        matrix = cls(words)
+
+        if not matrix.open_cache(path):
+            matrix.build()
+            matrix.write_cache(path)
+            matrix.open_cache(path)
+
+        return matrix
+
+    # ---------------------------------------------------------------------------------------------
+    #   Build
+    #
+    def build(self):
+        #
+        #   NumPy is optional, without it the table is built one pair at a time.  It is only
+        #   imported here so that importing the game does not pay for it
+        #
+        try:
+            from src.batch_scorer import encode_words, score_matrix
+        except ImportError:
+            score_matrix = None
+
+        if score_matrix is not None:
+            self.patterns = bytearray(score_matrix(encode_words(self.words)).tobytes())
+            return self
+
+        words = [word.lower() for word in self.words]
+        patterns = bytearray(self.size * self.size)
+
+        offset = 0
+        for guess in words:
+            for answer in words:
+                patterns[offset] = score(guess, answer)
+                offset += 1
+
+        self.patterns = patterns
+        return self
+
+    # ---------------------------------------------------------------------------------------------
+    #   Open Cache
+    #
+    def open_cache(self, path: str) -> bool:
+        try:
+            cache = open(path, "rb")
+        except FileNotFoundError:
+            return False
+
+        with cache:
+            header = cache.read(CacheHeader.size)
+            if len(header) != CacheHeader.size:
+                return False
+
+            magic, version, size, digest = CacheHeader.unpack(header)
+            if (magic, version, size) != (CacheMagic, CacheVersion, self.size):
+                return False
+
+            if digest != words_digest(self.words):
+                return False
+
+            if os.fstat(cache.fileno()).st_size != CacheHeader.size + size * size:
+                return False
+
+            mapped_file = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.mapped_file = mapped_file
+        self.patterns = memoryview(mapped_file)[CacheHeader.size:]
+        return True
+
+    # ---------------------------------------------------------------------------------------------
+    #   Write Cache
+    #
+    def write_cache(self, path: str):
+        """
+            Written to a temporary file and moved into place so a process reading the cache never
+            sees a partially written table.
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "wb") as cache:
+            cache.write(CacheHeader.pack(CacheMagic, CacheVersion, self.size, words_digest(self.words)))
+            cache.write(self.patterns)
+
+        os.replace(temp_path, path)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Index Of
+    #
+    def index_of(self, word: str | list[str]) -> int | None:
+        return self.indices.get("".join(word).lower())
+
+    # ---------------------------------------------------------------------------------------------
+    #   Pattern
+    #
+    def pattern(self, guess: str | list[str], answer: str | list[str]) -> int | None:
+        """
+            Table lookup for the encoded pattern.  Returns None when either word is not in the
+            table, in which case the caller has to score the pair itself.
+        """
+        guess_index = self.index_of(guess)
+        answer_index = self.index_of(answer)
+
+        if guess_index is None or answer_index is None:
+            return None
+
+        return self.patterns[guess_index * self.size + answer_index]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Row
+    #
+    def row(self, guess_index: int) -> memoryview:
+        start = guess_index * self.size
+        return memoryview(self.patterns)[start:start + self.size]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Get Flags
+    #
+    def get_flags(self, guess: str | list[str], answer: str | list[str]) -> list[int] | None:
+        pattern = self.pattern(guess, answer)
+
+        if pattern is None:
+            return None
+
+        return decode_pattern(pattern)
@@ -0,0 +1,59 @@
+import pygame as pg
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["FontRegistry", "GlyphAtlas"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Font Registry
+#
+#       One pg.font.Font per (family, size) for the whole game instead of one per Text/Button
+#
+class FontRegistry:
+    fonts: dict[tuple, pg.font.Font] = {}
+
+    @classmethod
+    def get(cls, family: str | None, size: int) -> pg.font.Font:
+        key = (family, size)
+        font = cls.fonts.get(key)
+
+        if font is None:
+            if not pg.font.get_init():
+                pg.font.init()
+            font = cls.fonts[key] = pg.font.Font(family, size)
+
+        return font
+
+
+# -------------------------------------------------------------------------------------------------
+#   Glyph Atlas
+#
+#       Every label (a letter or a key label such as "Return") is rendered once per font, size,
+#       antialias setting and color and the surface is shared by everything that shows it.
+#       Drawing a letter is then a blit of a surface that already exists.
+#
+class GlyphAtlas:
+    glyphs: dict[tuple, pg.Surface] = {}
+
+    @classmethod
+    def get(cls, label: str, family: str | None, size: int, antialias: bool, color) -> pg.Surface:
+        key = (label, family, size, antialias, color)
+        glyph = cls.glyphs.get(key)
+
+        if glyph is None:
+            glyph = FontRegistry.get(family, size).render(label, antialias, color)
+            #
+            #   Converted to the display format once it exists so blits skip the conversion
+            #
+            if pg.display.get_surface():
+                glyph = glyph.convert_alpha()
+            cls.glyphs[key] = glyph
+
+        return glyph
+
+    @classmethod
+    def preload(cls, labels, family: str | None, size: int, antialias: bool, color):
+        for label in labels:
+            cls.get(label, family, size, antialias, color)
@@ -0,0 +1,166 @@
+import atexit
+import csv
+import json
+from collections import deque
+from time import perf_counter_ns
+
+import pygame as pg
+
+import src.assets.definitions as df
+from src.fonts import FontRegistry
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["FrameProfiler", "frame_profiler"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Frame Profiler
+#
+#       Splits every rendered frame of Game.run into sections: parse, the render sections marked
+#       by the states (board, buttons, guess tiles, letters, keypad ...) and the display update.
+#       Each section is the time since the previous mark, so the sections of a frame add up to
+#       the whole frame.
+#
+#       Until enable() is called begin_frame, mark and end_frame do nothing.  enable() replaces
+#       them on the instance with the recording versions, so a game that is not being profiled
+#       never reads the clock.
+#
+class FrameProfiler:
+    #
+    #   Export columns, in the order a frame passes through them
+    #
+    sections = (
+        "parse", "background", "board", "buttons", "guess tiles", "letters", "keypad", "logo",
+        "overlay", "display"
+    )
+
+    def __init__(self, window: int = 600):
+        self.window = window
+        self.enabled = False
+        self.overlay = False
+        #
+        #   section --> milliseconds of the latest <window> frames, "frame" is the whole frame
+        #
+        self.history: dict[str, deque] = {}
+        self.frames = 0
+
+        self.current: dict[str, int] = {}
+        self.start = 0
+        self.last = 0
+
+        self.export = None
+        self.writer = None
+
+    # ---------------------------------------------------------------------------------------------
+    #   Disabled
+    #
+    def begin_frame(self):
+        pass
+
+    def mark(self, section: str):
+        pass
+
+    def end_frame(self):
+        pass
+
+    # ---------------------------------------------------------------------------------------------
+    #   Enable
+    #
+    def enable(self, export: str | None = None, overlay: bool = False):
+        """
+            Starts recording.  <export> is a .csv file with one column per section, or any other
+            name for one JSON object per line.  <overlay> draws p50/p95/p99 in the top left
+            corner of the screen
+        """
+        self.enabled = True
+        self.overlay = overlay
+
+        self.begin_frame = self.record_begin
+        self.mark = self.record_mark
+        self.end_frame = self.record_end
+
+        if export:
+            self.export = open(export, "w", newline="")
+            atexit.register(self.export.close)
+
+            if export.endswith(".csv"):
+                self.writer = csv.writer(self.export)
+                self.writer.writerow(["frame", "total", *self.sections])
+
+    # ---------------------------------------------------------------------------------------------
+    #   Record
+    #
+    def record_begin(self):
+        self.current = {}
+        self.start = self.last = perf_counter_ns()
+
+    def record_mark(self, section: str):
+        now = perf_counter_ns()
+        self.current[section] = self.current.get(section, 0) + now - self.last
+        self.last = now
+
+    def record_end(self):
+        self.frames += 1
+        frame = {section: elapsed / 1_000_000 for section, elapsed in self.current.items()}
+        frame["frame"] = (self.last - self.start) / 1_000_000
+
+        for section, elapsed in frame.items():
+            history = self.history.get(section)
+            if history is None:
+                history = self.history[section] = deque(maxlen=self.window)
+            history.append(elapsed)
+
+        if self.writer is not None:
+            self.writer.writerow(
+                [self.frames, f"{frame['frame']:.4f}", *(f"{frame.get(section, 0):.4f}" for section in self.sections)]
+            )
+        elif self.export is not None:
+            self.export.write(json.dumps({"frame": self.frames, **frame}) + "\n")
+
+    # ---------------------------------------------------------------------------------------------
+    #   Percentiles
+    #
+    def percentiles(self, section: str) -> tuple[float, float, float]:
+        """
+            p50, p95 and p99 in milliseconds over the latest frames
+        """
+        ordered = sorted(self.history.get(section, ()))
+
+        if not ordered:
+            return 0.0, 0.0, 0.0
+
+        return tuple(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] for fraction in (0.50, 0.95, 0.99))
+
+    # ---------------------------------------------------------------------------------------------
+    #   Draw Overlay
+    #
+    def draw_overlay(self, canvas: pg.Surface) -> pg.Rect | None:
+        """
+            Draws the percentiles of the sections seen so far over the top left corner of
+            <canvas> and returns the area drawn on, None while the overlay is off
+        """
+        if not self.overlay:
+            return None
+
+        font = FontRegistry.get(df.main_font, df.ProfilerFontSize)
+        rows = ["frame", *(section for section in self.sections if section in self.history)]
+        line_height = font.get_linesize()
+
+        area = pg.Rect(0, 0, df.ProfilerOverlayWidth, line_height * (len(rows) + 1) + 4)
+        canvas.fill(df.ProfilerOverlayColor, area)
+        canvas.blit(font.render(f"{'ms':<12}{'p50':>7}{'p95':>7}{'p99':>7}", True, df.FontColor), (4, 2))
+
+        for row, section in enumerate(rows, start=1):
+            p50, p95, p99 = self.percentiles(section)
+            line = f"{section:<12}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}"
+            canvas.blit(font.render(line, True, df.FontColor), (4, 2 + row * line_height))
+
+        return area
+
+
+# -------------------------------------------------------------------------------------------------
+#   Shared by Game and the states
+#
+frame_profiler = FrameProfiler()
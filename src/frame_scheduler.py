@@ -0,0 +1,94 @@
+from collections import deque
+from typing import Callable
+
+import pygame as pg
+
+import src.assets.definitions as df
+from src.dirty_regions import dirty_regions
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["FrameScheduler"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Frame Scheduler
+#
+#       Replaces the fixed clock.tick(Fps) loop.  While nothing is dirty the game sleeps in
+#       pg.event.wait and only wakes up for input, for a scheduled deadline (animations, timers)
+#       or after max_latency milliseconds at the latest.  Frames are only rendered when
+#       something is dirty, at most max_fps times a second when a cap is set.
+#
+#       Deferred tasks (loading assets that are not needed yet) run one at a time while there is
+#       nothing to draw, the event queue is checked between them.
+#
+class FrameScheduler:
+    def __init__(self, max_fps: int | None = df.Fps, max_latency: int = df.MaxEventWait):
+        self.max_fps = max_fps
+        self.max_latency = max_latency
+        self.clock = pg.time.Clock()
+        self.deadlines: list[int] = []
+        self.tasks: deque[Callable[[], object]] = deque()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Schedule
+    #
+    def schedule(self, delay: int):
+        """
+            Wake up in <delay> milliseconds even if no event arrives, e.g. for the next step of an
+            animation
+        """
+        self.deadlines.append(pg.time.get_ticks() + delay)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Defer
+    #
+    def defer(self, task: Callable[[], object]):
+        """
+            Run <task> the next time the game is idle
+        """
+        self.tasks.append(task)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Wait
+    #
+    def wait(self) -> list[pg.event.Event]:
+        """
+            Blocks until there is input, a deadline has passed or max_latency is up, then returns
+            every queued event.  Does not block at all while a frame is still waiting to be drawn
+            or a deadline is already due.
+        """
+        now = pg.time.get_ticks()
+        pending = [deadline for deadline in self.deadlines if deadline > now]
+        due = len(pending) != len(self.deadlines)
+        self.deadlines = pending
+
+        if due or dirty_regions.is_dirty:
+            return pg.event.get()
+
+        if self.tasks:
+            self.tasks.popleft()()
+            return pg.event.get()
+
+        timeout = self.max_latency
+        if self.deadlines:
+            timeout = min(timeout, min(self.deadlines) - now)
+        #
+        #   pg.event.wait(0) waits for an event without a time limit, so wait at least 1 ms
+        #
+        first = pg.event.wait(max(1, timeout))
+        if first.type == pg.NOEVENT:
+            return []
+
+        return [first, *pg.event.get()]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Frame Rendered
+    #
+    def frame_rendered(self):
+        """
+            Called after each rendered frame, holds the frame rate to max_fps
+        """
+        if self.max_fps:
+            self.clock.tick(self.max_fps)
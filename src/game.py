@@ -1,7 +1,12 @@
 import pygame as pg
 
 import src.assets.definitions as df
+import src.wordle_words as words
+from src.answer_deck import AnswerDeck
+from src.dirty_regions import dirty_regions
 from src.event_manager import EventManager
+from src.frame_profiler import frame_profiler
+from src.frame_scheduler import FrameScheduler
 from src.state_manager import StateManager
 
 # -------------------------------------------------------------------------------------------------
@@ -15,13 +20,18 @@ __all__ = ['Game']
 #
 class Game:
 
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
+        """
+            <seed> fixes the order the answers are dealt in
+        """
         pg.init()
         self.canvas = pg.display.set_mode(df.ScreenDimensions, pg.SCALED)
-        self.clock = pg.time.Clock()
+        self.scheduler = FrameScheduler()
 
         self.event_manager = EventManager()
-        self.state_manager = StateManager(self.canvas, self.event_manager)
+        self.state_manager = StateManager(
+            self.canvas, self.event_manager, self.scheduler, AnswerDeck(words.all_words, seed)
+        )
 
     # -------------------------------------------------------------------------------------------------
     #   Run
@@ -31,12 +41,36 @@ class Game:
         self.initialize()
 
         while True:
-            self.clock.tick(df.Fps)
-            self.canvas.fill(df.BgColor)
-            self.event_manager.parse()
-            self.update()
+            events = self.scheduler.wait()
 
-            pg.display.flip()
+            frame_profiler.begin_frame()
+            self.event_manager.parse(events)
+            frame_profiler.mark("parse")
+
+            if dirty_regions.is_dirty:
+                self.redraw(dirty_regions.take(self.canvas.get_rect()))
+                frame_profiler.end_frame()
+                self.scheduler.frame_rendered()
+
+    # -------------------------------------------------------------------------------------------------
+    #   Redraw
+    #
+    def redraw(self, rects: list[pg.Rect]):
+        """
+            Everything is drawn clipped to the area around the dirty regions, and only the dirty
+            regions are sent to the display
+        """
+        self.canvas.set_clip(rects[0].unionall(rects[1:]))
+        self.update()
+        self.canvas.set_clip(None)
+
+        overlay = frame_profiler.draw_overlay(self.canvas)
+        if overlay:
+            rects = [*rects, overlay]
+            frame_profiler.mark("overlay")
+
+        pg.display.update(rects)
+        frame_profiler.mark("display")
 
     # -------------------------------------------------------------------------------------------------
     #   Update
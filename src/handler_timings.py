@@ -0,0 +1,143 @@
+import json
+from collections import deque
+
+import pygame as pg
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["HandlerTimings"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Handler Timings
+#
+#       Wall time of every handler call made by EventManager.notify, per (event type, handler
+#       class).  The last <window> samples of each are kept so the percentiles follow what the
+#       game is doing now rather than averaging over the whole session.
+#
+#       Only used once EventManager.enable_timing has been called, until then notify does not
+#       read the clock at all.
+#
+class HandlerTimings:
+    def __init__(self, budget: float = df.HandlerBudget, window: int = 512, path: str = df.handler_timings):
+        #
+        #   Milliseconds a single handler call may take
+        #
+        self.budget = budget
+        self.window = window
+        self.path = path
+        #
+        #   (event type, handler class name) --> nanoseconds of the latest calls
+        #
+        self.samples: dict[tuple[int, str], deque] = {}
+        self.calls: dict[tuple[int, str], int] = {}
+        self.over_budget: dict[tuple[int, str], int] = {}
+
+    # ---------------------------------------------------------------------------------------------
+    #   Record
+    #
+    def record(self, event_type: int, handler, elapsed: int):
+        """
+            <elapsed> is in nanoseconds (time.perf_counter_ns)
+        """
+        key = (event_type, type(handler).__name__)
+        samples = self.samples.get(key)
+
+        if samples is None:
+            samples = self.samples[key] = deque(maxlen=self.window)
+            self.calls[key] = 0
+            self.over_budget[key] = 0
+
+        samples.append(elapsed)
+        self.calls[key] += 1
+
+        if elapsed > self.budget * 1_000_000:
+            self.over_budget[key] += 1
+
+    # ---------------------------------------------------------------------------------------------
+    #   Event Name
+    #
+    @staticmethod
+    def event_name(event_type: int) -> str:
+        """
+            Handlers are subscribed to key codes (K_a, K_RETURN) as well as to event types
+            (MOUSEMOTION), key codes used by the game are all below the first event type
+        """
+        if event_type < pg.KEYDOWN:
+            return pg.key.name(event_type)
+
+        return pg.event.event_name(event_type)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Summary
+    #
+    def summary(self) -> list[dict]:
+        """
+            One entry per (event type, handler class), slowest p99 first.  Times are in
+            milliseconds
+        """
+        entries = []
+
+        for key, samples in self.samples.items():
+            ordered = sorted(samples)
+
+            def percentile(fraction: float) -> float:
+                return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1_000_000
+
+            entries.append({
+                "event": self.event_name(key[0]),
+                "handler": key[1],
+                "calls": self.calls[key],
+                "over_budget": self.over_budget[key],
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": ordered[-1] / 1_000_000,
+            })
+
+        entries.sort(key=lambda entry: entry["p99"], reverse=True)
+
+        return entries
+
+    # ---------------------------------------------------------------------------------------------
+    #   Slow Handlers
+    #
+    def slow_handlers(self) -> list[dict]:
+        return [entry for entry in self.summary() if entry["over_budget"]]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Report
+    #
+    def report(self) -> str:
+        slow = self.slow_handlers()
+
+        if not slow:
+            return f"no handler took longer than {self.budget:g} ms"
+
+        lines = [f"handlers over {self.budget:g} ms:"]
+
+        for entry in slow:
+            lines.append(
+                f"  {entry['event']:<16} {entry['handler']:<30} {entry['over_budget']:>6}/{entry['calls']:<6}"
+                f" p50 {entry['p50']:.3f}  p95 {entry['p95']:.3f}  p99 {entry['p99']:.3f}  max {entry['max']:.3f}"
+            )
+
+        return "\n".join(lines)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Dump
+    #
+    def dump(self, path: str | None = None):
+        """
+            Writes the summary as JSON and prints the handlers that went over budget
+        """
+        path = path or self.path
+
+        with open(path, "w") as file:
+            json.dump({"budget": self.budget, "window": self.window, "handlers": self.summary()}, file, indent=2)
+
+        print(self.report())
+        print(f"handler timings written to {path}")
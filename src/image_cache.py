@@ -0,0 +1,98 @@
+from hashlib import sha256
+from pathlib import Path
+import os
+import struct
+
+import pygame as pg
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["ImageCache"]
+
+# -------------------------------------------------------------------------------------------------
+#   Cached image format
+#
+#       magic, version, width, height, followed by width * height RGBA pixels
+#
+ImageMagic = b"WIMG"
+ImageVersion = 1
+ImageHeader = struct.Struct("<4sHII")
+CacheDir = str(Path(__file__).resolve().parent / df.image_cache)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Image Cache
+#
+#       Images are decoded and scaled once.  The scaled pixels are stored in CacheDir
+#       under the hash of the source file and the target size, so changing either the image
+#       or the size produces a new entry.  Later launches read the raw pixels back instead of
+#       decoding the PNG and resampling it.
+#
+#       Surfaces are converted to the display format when a display exists, so blits are plain
+#       copies.  Load images after pg.display.set_mode.
+#
+class ImageCache:
+    images: dict[tuple, pg.Surface] = {}
+
+    @classmethod
+    def get(cls, path: str, size: tuple[int, int], cache_dir: str = CacheDir) -> pg.Surface:
+        with open(path, "rb") as file:
+            source = file.read()
+
+        digest = sha256(source).hexdigest()[:16]
+        key = (digest, size)
+        image = cls.images.get(key)
+
+        if image is None:
+            cache_path = os.path.join(cache_dir, f"{digest}-{size[0]}x{size[1]}.bin")
+            image = cls.read(cache_path, size)
+
+            if image is None:
+                image = pg.transform.scale(pg.image.load(path), size)
+                cls.write(cache_path, image)
+
+            if pg.display.get_surface():
+                image = image.convert_alpha()
+            cls.images[key] = image
+
+        return image
+
+    # ---------------------------------------------------------------------------------------------
+    #   Read
+    #
+    @staticmethod
+    def read(path: str, size: tuple[int, int]) -> pg.Surface | None:
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        if len(data) != ImageHeader.size + 4 * size[0] * size[1]:
+            return None
+
+        magic, version, width, height = ImageHeader.unpack_from(data)
+        if (magic, version, (width, height)) != (ImageMagic, ImageVersion, tuple(size)):
+            return None
+
+        return pg.image.frombytes(data[ImageHeader.size:], size, "RGBA")
+
+    # ---------------------------------------------------------------------------------------------
+    #   Write
+    #
+    @staticmethod
+    def write(path: str, image: pg.Surface):
+        """
+            Written to a temporary file and moved into place, see FeedbackMatrix.write_cache
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "wb") as file:
+            file.write(ImageHeader.pack(ImageMagic, ImageVersion, *image.get_size()))
+            file.write(pg.image.tobytes(image, "RGBA"))
+
+        os.replace(temp_path, path)
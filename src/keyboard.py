@@ -1,8 +1,10 @@
-from copy import deepcopy
 from enum import IntEnum
 
-from src.rectangle import Rectangle, RectangleBuilder
-from src.text import Text, TextBuilder
+from src.dirty_regions import dirty_regions
+from src.prototype import compile_template
+from src.rectangle import Rectangle
+from src.spatial_index import GridIndex
+from src.text import Text
 
 import src.assets.definitions as df
 import src.assets.templates as tpl
@@ -12,6 +14,17 @@ import src.assets.templates as tpl
 #
 __all__ = ["Keyboard"]
 
+# -------------------------------------------------------------------------------------------------
+#   Compiled templates
+#
+keypad_key = compile_template(Rectangle.create, tpl.keyboard_template)
+return_key = compile_template(Rectangle.create, tpl.return_key_template)
+backspace_key = compile_template(Rectangle.create, tpl.backspace_key_template)
+
+key_letter = compile_template(Text.create, tpl.keyboard_font_template)
+return_letter = compile_template(Text.create, tpl.return_font_template)
+delete_letter = compile_template(Text.create, tpl.delete_font_template)
+
 
 # -------------------------------------------------------------------------------------------------
 #
@@ -25,6 +38,15 @@ class Index(IntEnum):
 #   Keyboard
 #
 class Keyboard:
+    #
+    #   Flag --> key color
+    #
+    flag_colors = {
+        df.InvalidPos: df.InvalidChosenKeyColor,
+        df.ValidIncorrectPos: df.ValidIncorrectPosKeyColor,
+        df.ValidCorrectPos: df.ValidCorrectPosKeyColor
+    }
+
     """
     The Keyboard class consists of a collection of (1) rectangles
     that represent a hybrid keyboard keypad; (2) the letters of
@@ -49,6 +71,22 @@ class Keyboard:
         #   Contains the flags for each row entry the user makes
         #
         self.flags: list[list[int]] = []
+        #
+        #   Color each key returns to when it is not hovered, one per key, in keypad order
+        #
+        self.key_colors: list[tuple[int, int, int]] = []
+        #
+        #   Letter --> index of its key
+        #
+        self.letter_keys: dict[str, int] = {}
+        #
+        #   Mouse position --> key index, built with the keypad
+        #
+        self.key_index: GridIndex | None = None
+        #
+        #   Index of the key currently under the mouse
+        #
+        self.hovered: int | None = None
 
     # ---------------------------------------------------------------------------------------------
     #   New Game
@@ -57,6 +95,21 @@ class Keyboard:
         self.chosen_letters.clear()
         self.flags.clear()
 
+        for key in self.keypad:
+            self.key_colors[key.index] = df.KeyAvailableColor
+            self.set_key_color(key, df.KeyAvailableColor)
+
+        self.hovered = None
+
+    # ---------------------------------------------------------------------------------------------
+    #   Key At
+    #
+    def key_at(self, pos) -> int | None:
+        """
+            Index of the keypad key under <pos>, or None
+        """
+        return self.key_index.hit(pos)
+
     # ---------------------------------------------------------------------------------------------
     #   Get Letters
     #
@@ -67,6 +120,12 @@ class Keyboard:
     #   Build
     #
     def build(self):
+        """
+            Builds the keypad once, later calls keep it (see Board.build)
+        """
+        if self.keypad:
+            return
+
         self.build_keypad()
         self.build_letters()
 
@@ -78,26 +137,22 @@ class Keyboard:
         Builds the rectangular borders that represent the alpha keys of a QWERTY keyboard
         as well as the Return and Backspace keys
         """
-        builder = RectangleBuilder()
         base_x_coords = [df.KeyboardBaseXR1, df.KeyboardBaseXR2, df.KeyboardBaseXR3]
 
         index = 0
         for row in range(df.KeyboardRows):
             for col in range(df.KeyboardColsPerRow[row]):
-                kb = deepcopy(tpl.keyboard_template)
-
                 x_coord = base_x_coords[row] + (df.KeyboardWidth + df.KeyboardGap) * col
                 y_coord = df.KeyboardBaseY + (df.KeyboardHeight + df.KeyboardGap) * row
 
-                kb['x_coord'] = x_coord
-                kb['y_coord'] = y_coord
-                kb['index'] = index
-
+                self.keypad.append(keypad_key.clone(x_coord=x_coord, y_coord=y_coord, index=index))
                 index += 1
-                self.keypad.append(builder.build(kb))
 
-        self.keypad.append(builder.build(tpl.return_key_template))
-        self.keypad.append(builder.build(tpl.backspace_key_template))
+        self.keypad.append(return_key.clone())
+        self.keypad.append(backspace_key.clone())
+
+        self.key_index = GridIndex([key.rectangle for key in self.keypad])
+        self.key_colors = [df.KeyAvailableColor] * len(self.keypad)
 
     # ---------------------------------------------------------------------------------------------
     #   Build Letters
@@ -107,20 +162,14 @@ class Keyboard:
         Build all the renderable letters that represent the keypad as well as the text for the
         return and backspace keys
         """
-        builder = TextBuilder()
-        kb_font = tpl.keyboard_font_template
-        ret_font = tpl.return_font_template
-        del_font = tpl.delete_font_template
         alphabet = df.qwerty
 
         for index in range(df.AlphabetLength):
-            tmp = deepcopy(kb_font)
-
-            tmp["label"] = alphabet[index]
-            self.letters.append(builder.build(tmp))
+            self.letters.append(key_letter.clone(label=alphabet[index]))
+            self.letter_keys[alphabet[index]] = index
 
-        self.letters.append(builder.build(ret_font))
-        self.letters.append(builder.build(del_font))
+        self.letters.append(return_letter.clone())
+        self.letters.append(delete_letter.clone())
 
     # ---------------------------------------------------------------------------------------------
     #   Set Flags and Letter
@@ -138,6 +187,19 @@ class Keyboard:
             if letter not in self.chosen_letters:
                 self.flags.append(args[Index.Flags][index])
                 self.chosen_letters.append(args[Index.Letters][index])
+                self.key_colors[self.letter_keys[letter]] = self.flag_colors[args[Index.Flags][index]]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Set Key Color
+    #
+    @staticmethod
+    def set_key_color(key: Rectangle, color: tuple[int, int, int]):
+        """
+            Only keys whose color actually changes are marked for redrawing
+        """
+        if key.color != color:
+            key.color = color
+            dirty_regions.mark(key.rectangle)
 
     # ---------------------------------------------------------------------------------------------
     #   Update Key
@@ -149,26 +211,7 @@ class Keyboard:
 
         Resets the background color after mouse over
         """
-        if not (self.chosen_letters and self.flags):
-            key.color = df.KeyAvailableColor
-        else:
-            keypad_letter = self.letters[key.index].label
-
-            if keypad_letter in self.chosen_letters:
-                letter_index = self.chosen_letters.index(keypad_letter)
-                corresponding_flag = self.flags[letter_index]
-                rect_index = df.qwerty.index(keypad_letter)
-
-                if corresponding_flag == df.InvalidPos:
-                    self.keypad[rect_index].color = df.InvalidChosenKeyColor
-
-                if corresponding_flag == df.ValidIncorrectPos:
-                    self.keypad[rect_index].color = df.ValidIncorrectPosKeyColor
-
-                if corresponding_flag == df.ValidCorrectPos:
-                    self.keypad[rect_index].color = df.ValidCorrectPosKeyColor
-            else:
-                key.color = df.KeyAvailableColor
+        self.set_key_color(key, self.key_colors[key.index])
 
     # ---------------------------------------------------------------------------------------------
     #   Update Keypad
@@ -179,24 +222,15 @@ class Keyboard:
             --> WordManager(validate)
             --> update_keypad
 
-            The function set_flags_and_letters has to be called prior
+            The function set_flags_and_letters has to be called prior, it sets the color of
+            every chosen letter's key:
 
-            All flags are one-to-one with letters
+                Invalid                     = -1 --> Grey
+                Valid Incorrect Position    = 0  --> Yellow
+                Valid Correct Position      = 1  --> Green
 
-            Rectangles and letters are in 1-1 correspondence
+            The key under the mouse keeps its hover color until the mouse leaves it
         """
-        rect_indices = [df.qwerty.index(i) for i in self.chosen_letters]
-        #
-        #   Invalid                     = -1 --> Grey
-        #   Valid Incorrect Position    = 0  --> Yellow
-        #   Valid Correct Position      = 1  --> Green
-        #
-        for flag, index in zip(self.flags, rect_indices):
-            if flag == df.InvalidPos:
-                self.keypad[index].color = df.InvalidChosenKeyColor
-
-            if flag == df.ValidIncorrectPos:
-                self.keypad[index].color = df.ValidIncorrectPosKeyColor
-
-            if flag == df.ValidCorrectPos:
-                self.keypad[index].color = df.ValidCorrectPosKeyColor
+        for key in self.keypad:
+            if key.index != self.hovered:
+                self.set_key_color(key, self.key_colors[key.index])
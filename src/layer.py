@@ -0,0 +1,44 @@
+from typing import Callable
+
+import pygame as pg
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["StaticLayer"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Static Layer
+#
+#       Geometry that never changes once the layout is built (board grid outlines, button
+#       borders) is drawn once onto its own surface.  Each frame starts with a single blit of
+#       that surface and the dynamic layers are drawn on top.
+#
+class StaticLayer:
+    def __init__(self, draw: Callable[[pg.Surface], None]):
+        self.draw = draw
+        self.surface: pg.Surface | None = None
+        self.key = None
+
+    # ---------------------------------------------------------------------------------------------
+    #   Get
+    #
+    def get(self, key) -> pg.Surface:
+        """
+            <key> describes the layout the layer is drawn from, the layer is only drawn again
+            when it changes
+        """
+        if self.surface is None or (key is not self.key and key != self.key):
+            surface = pg.Surface(df.ScreenDimensions)
+            surface.fill(df.BgColor)
+            self.draw(surface)
+            #
+            #   Converted to the display format so the per-frame blit is a straight copy
+            #
+            self.surface = surface.convert() if pg.display.get_surface() else surface
+            self.key = key
+
+        return self.surface
@@ -0,0 +1,211 @@
+from argparse import ArgumentParser
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+from time import perf_counter
+import struct
+import sys
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["PackedWords"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Packing
+#
+#       Each five-letter word is stored as a 25-bit integer, 5 bits per letter (a = 0 ... z = 25)
+#       with the first letter in the lowest bits.
+#
+#       File layout: magic (4 bytes) | word count (uint32) | count * uint32, all little endian
+#
+BitsPerLetter = 5
+LetterMask = (1 << BitsPerLetter) - 1
+PackedMagic = b"WWRD"
+PackedHeader = struct.Struct("<4sI")
+PackedPath = str(Path(__file__).resolve().parent / df.packed_words)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Packed Words
+#
+class PackedWords(Sequence):
+    """
+        Read-only, list-like view over packed words.  Indexing and iteration decode to the same
+        lower case strings the word list was built from.
+
+        Membership and index() binary search a sorted copy of the packed codes built once at
+        load time, so checking a guess does not scan the list.  The index is two flat uint32
+        arrays (about 45 KB for the full list) rather than a dict of int objects.
+    """
+
+    def __init__(self, codes: array):
+        self.codes = codes
+        #
+        #   The codes in ascending order and, in parallel, where each one is in <codes>.  The sort
+        #   is stable so a duplicate finds its first index first, like list.index
+        #
+        order = sorted(range(len(codes)), key=codes.__getitem__)
+        self.sorted_codes = array("I", (codes[index] for index in order))
+        self.sorted_indices = array("I", order)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Load
+    #
+    @classmethod
+    def load(cls, path: str = PackedPath):
+        with open(path, "rb") as packed:
+            data = packed.read()
+
+        magic, count = PackedHeader.unpack_from(data)
+        if magic != PackedMagic:
+            raise ValueError(f"{path} is not a packed word list")
+
+        codes = array("I")
+        codes.frombytes(data[PackedHeader.size:PackedHeader.size + count * codes.itemsize])
+
+        if sys.byteorder == "big":
+            codes.byteswap()
+
+        return cls(codes)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Write
+    #
+    @staticmethod
+    def write(words, path: str = PackedPath):
+        codes = array("I", (PackedWords.encode(word) for word in words))
+
+        if sys.byteorder == "big":
+            codes.byteswap()
+
+        with open(path, "wb") as packed:
+            packed.write(PackedHeader.pack(PackedMagic, len(codes)))
+            codes.tofile(packed)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Is Word
+    #
+    @staticmethod
+    def is_word(word) -> bool:
+        return isinstance(word, str) and len(word) == df.MaxLetters and word.isascii() and word.isalpha()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Encode
+    #
+    @staticmethod
+    def encode(word: str) -> int:
+        code = 0
+
+        for pos, char in enumerate(word.lower()):
+            code |= (ord(char) - ord("a")) << (BitsPerLetter * pos)
+
+        return code
+
+    # ---------------------------------------------------------------------------------------------
+    #   Decode
+    #
+    @staticmethod
+    def decode(code: int) -> str:
+        return "".join(
+            chr(ord("a") + ((code >> (BitsPerLetter * pos)) & LetterMask)) for pos in range(df.MaxLetters)
+        )
+
+    # ---------------------------------------------------------------------------------------------
+    #   Sequence
+    #
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.decode(code) for code in self.codes[index]]
+
+        return self.decode(self.codes[index])
+
+    def __iter__(self):
+        return map(self.decode, self.codes)
+
+    def __contains__(self, word):
+        return self.find(word) >= 0
+
+    def index(self, word, start=0, stop=None):
+        if start == 0 and stop is None:
+            index = self.find(word)
+            if index < 0:
+                raise ValueError(f"{word!r} is not in the word list")
+            return index
+
+        return super().index(word, start, stop)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Find
+    #
+    def find(self, word) -> int:
+        """
+            First index of <word>, -1 when it is not in the list
+        """
+        if not self.is_word(word):
+            return -1
+
+        code = self.encode(word)
+        position = bisect_left(self.sorted_codes, code)
+
+        if position < len(self.sorted_codes) and self.sorted_codes[position] == code:
+            return self.sorted_indices[position]
+
+        return -1
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.codes)} words)"
+
+
+# -------------------------------------------------------------------------------------------------
+#   Benchmark
+#
+def benchmark(lookups: int = 100_000):
+    """
+        Per-lookup cost of a membership check against the sorted index and against a plain list
+    """
+    words = PackedWords.load()
+    plain = list(words)
+    guesses = [plain[index * 7919 % len(plain)] for index in range(100)] + ["zzzzz"] * 100
+
+    start = perf_counter()
+    for index in range(lookups):
+        guesses[index % len(guesses)] in words
+    index_time = perf_counter() - start
+
+    start = perf_counter()
+    for index in range(lookups // 100):
+        guesses[index % len(guesses)] in plain
+    list_time = (perf_counter() - start) * 100
+
+    print(f"{len(words)} words, {lookups} lookups")
+    print(f"index      : {index_time / lookups * 1e9:8.0f} ns per lookup")
+    print(f"list scan  : {list_time / lookups * 1e9:8.0f} ns per lookup")
+
+
+# -------------------------------------------------------------------------------------------------
+#   Command Line
+#
+#       python -m src.packed_words words.txt        packs a plain text list, one word per line
+#       python -m src.packed_words --benchmark      times word lookups
+#
+if __name__ == "__main__":
+    parser = ArgumentParser(prog="python -m src.packed_words")
+    parser.add_argument("word_file", nargs="?")
+    parser.add_argument("--benchmark", action="store_true")
+    arguments = parser.parse_args()
+
+    if arguments.benchmark:
+        benchmark()
+    elif arguments.word_file:
+        with open(arguments.word_file) as word_file:
+            PackedWords.write(line.strip() for line in word_file if line.strip())
+    else:
+        parser.print_usage()
@@ -0,0 +1,51 @@
+from inspect import Parameter, signature
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["Prototype", "compile_template"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Prototype
+#
+#       A template from assets/templates.py compiled against the factory that builds from it
+#       (Rectangle.create, Text.create, Button.create).  The values are resolved once, when
+#       the template is compiled.  clone passes them straight to the factory with the overrides
+#       of the widget being built, so there is no deepcopy of the template and no
+#       hasattr/setattr per key.
+#
+class Prototype(NamedTuple):
+    factory: Callable
+    values: Mapping
+
+    # ---------------------------------------------------------------------------------------------
+    #   Clone
+    #
+    def clone(self, **overrides):
+        """
+            A new object built from the template, with <overrides> replacing template values.
+            Overriding a field the factory does not have raises TypeError
+        """
+        return self.factory(**{**self.values, **overrides})
+
+
+# -------------------------------------------------------------------------------------------------
+#   Compile Template
+#
+def compile_template(factory: Callable, template: dict) -> Prototype:
+    """
+        Fields of <factory> missing from <template> keep the factory's defaults.  Template keys
+        the factory does not have are ignored, the same as the reflection builders ignore them
+    """
+    parameters = signature(factory).parameters
+    values = {
+        name: parameter.default
+        for name, parameter in parameters.items()
+        if parameter.default is not Parameter.empty
+    }
+    values.update((key, value) for key, value in template.items() if key in parameters)
+
+    return Prototype(factory, MappingProxyType(values))
@@ -63,9 +63,16 @@ class RectangleSetter:
 # -------------------------------------------------------------------------------------------------
 #   Rectangle Class
 #
+#       Slotted, the board and keypad hold 86 of these.  The values are copied out of the setter,
+#       which the builder reuses for every rectangle, so no reference to it is kept
+#
 class Rectangle:
+    __slots__ = (
+        "_x_coord", "_y_coord", "_width", "_height", "_thickness", "_curve", "_color", "_index",
+        "_rectangle"
+    )
+
     def __init__(self, setter: RectangleSetter):
-        self.setter = setter
         self._x_coord = setter.x_coord
         self._y_coord = setter.y_coord
         self._width = setter.width
@@ -80,6 +87,28 @@ class Rectangle:
         else:
             self._rectangle = self.set_rectangle()
 
+    # ---------------------------------------------------------------------------------------------
+    #   Create
+    #
+    #       Builds a rectangle straight from its values, used by compiled templates (see
+    #       prototype.py)
+    #
+    @classmethod
+    def create(cls, x_coord=None, y_coord=None, width=None, height=None, thickness=None, curve=None,
+               color=None, index=None):
+        rectangle = cls.__new__(cls)
+        rectangle._x_coord = x_coord
+        rectangle._y_coord = y_coord
+        rectangle._width = width
+        rectangle._height = height
+        rectangle._thickness = thickness
+        rectangle._curve = curve
+        rectangle._color = color
+        rectangle._index = index
+        rectangle._rectangle = rectangle.set_rectangle()
+
+        return rectangle
+
     # ---------------------------------------------------------------------------------------------
     #   Repr
     def __repr__(self):
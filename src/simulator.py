@@ -0,0 +1,177 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from src.answer_deck import AnswerDeck
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix
+from src.solver import EntropySolver
+from src.strategy import strategies
+
+import src.assets.definitions as df
+import src.wordle_words as words
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["Simulator", "SimulationResult"]
+
+# -------------------------------------------------------------------------------------------------
+#   Histogram key for games that ran out of guesses
+#
+Lost = 0
+
+# -------------------------------------------------------------------------------------------------
+#   Per-process engine and strategy, created once by the pool initializer
+#
+_engine: WordleEngine | None = None
+_strategy = None
+
+
+# -------------------------------------------------------------------------------------------------
+#   Start Worker
+#
+def _start_worker(strategy_name: str, use_matrix: bool, strategy_options: dict):
+    global _engine, _strategy
+
+    matrix = FeedbackMatrix.load(words.all_words) if use_matrix else None
+    _engine = WordleEngine(feedback_matrix=matrix)
+    _strategy = strategies[strategy_name](**strategy_options)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Play Games
+#
+def _play_games(answers: list[str]) -> Counter:
+    """
+        Plays one game per answer and counts the number of guesses each win took.  A strategy
+        that offers a word the engine rejects loses the game.
+    """
+    histogram = Counter()
+
+    for answer in answers:
+        _engine.new_game(answer)
+        _strategy.new_game()
+
+        while not _engine.game_over:
+            if _engine.play(_strategy.next_guess(_engine)) is None:
+                break
+
+        histogram[len(_engine.guesses) if _engine.won else Lost] += 1
+
+    return histogram
+
+
+# -------------------------------------------------------------------------------------------------
+#   Simulation Result
+#
+class SimulationResult:
+    def __init__(self, histogram: Counter, seconds: float):
+        self.histogram = histogram
+        self.seconds = seconds
+
+    # ---------------------------------------------------------------------------------------------
+    #   Properties
+    #
+    @property
+    def games(self) -> int:
+        return sum(self.histogram.values())
+
+    @property
+    def wins(self) -> int:
+        return self.games - self.histogram[Lost]
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        total = sum(guesses * count for guesses, count in self.histogram.items())
+        return total / self.wins if self.wins else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    # ---------------------------------------------------------------------------------------------
+    #   Report
+    #
+    def report(self) -> str:
+        lines = []
+        widest = max(self.histogram.values(), default=0)
+
+        for guesses in [*range(1, df.BoardRows + 1), Lost]:
+            count = self.histogram[guesses]
+            bar = "#" * round(40 * count / widest) if widest else ""
+            label = "X" if guesses == Lost else str(guesses)
+            lines.append(f"{label:>2} {count:>7} {bar}")
+
+        lines.append(f"games          {self.games}")
+        lines.append(f"win rate       {self.win_rate:.2%}")
+        lines.append(f"mean guesses   {self.mean_guesses:.3f}")
+        lines.append(f"games / second {self.games_per_second:,.0f}")
+
+        return "\n".join(lines)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Simulator
+#
+class Simulator:
+    """
+        Plays complete games with a strategy from strategy.strategies, spread over a pool of
+        worker processes.  Answers are dealt from an AnswerDeck, so the first len(all_words)
+        games cover every answer exactly once.
+    """
+
+    def __init__(
+            self,
+            strategy: str = "first",
+            workers: int | None = None,
+            seed: int | None = None,
+            use_matrix: bool = False,
+            chunk_size: int = 64
+    ):
+        if strategy not in strategies:
+            raise ValueError(f"Unknown strategy {strategy!r}, choose from {', '.join(strategies)}")
+
+        self.strategy = strategy
+        self.workers = workers
+        self.seed = seed
+        self.use_matrix = use_matrix
+        self.chunk_size = chunk_size
+
+    # ---------------------------------------------------------------------------------------------
+    #   Run
+    #
+    def run(self, games: int) -> SimulationResult:
+        #
+        #   Build the caches once here rather than racing to build them in every worker.  The
+        #   workers only map the feedback table, and the entropy strategy gets its opening
+        #   book handed over instead of reading it back
+        #
+        strategy_options = {}
+
+        if self.use_matrix or self.strategy == "entropy":
+            matrix = FeedbackMatrix.load(words.all_words)
+
+            if self.strategy == "entropy":
+                strategy_options["book"] = EntropySolver(matrix).opening_book()
+
+        deck = AnswerDeck(words.all_words, self.seed)
+        answers = [deck.draw() for _ in range(games)]
+        chunks = [answers[start:start + self.chunk_size] for start in range(0, games, self.chunk_size)]
+
+        histogram = Counter()
+        start = perf_counter()
+
+        with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_start_worker,
+                initargs=(self.strategy, self.use_matrix, strategy_options)
+        ) as pool:
+            for chunk_histogram in pool.map(_play_games, chunks):
+                histogram.update(chunk_histogram)
+
+        return SimulationResult(histogram, perf_counter() - start)
@@ -0,0 +1,327 @@
+from array import array
+from collections import Counter
+from math import log2
+from pathlib import Path
+import os
+import struct
+
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix, PatternCount, encode_flags, words_digest
+
+import src.assets.definitions as df
+
+# -------------------------------------------------------------------------------------------------
+#   NumPy is optional, without it the bucket counts are taken one guess at a time
+#
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["EntropySolver"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Opening Book File Layout
+#
+#       magic (4 bytes) | version (uint16) | word count (uint32) | sha256 of the word list
+#       followed by the opening guess and the second guess for each of the 243 feedback patterns
+#       (uint16 word indices, NoGuess for feedback the opening guess cannot get)
+#
+BookMagic = b"WOPN"
+BookVersion = 1
+BookHeader = struct.Struct("<4sHI32s")
+BookEntries = struct.Struct(f"<{1 + PatternCount}H")
+BookPath = str(Path(__file__).resolve().parent / df.opening_book)
+NoGuess = 0xFFFF
+
+# -------------------------------------------------------------------------------------------------
+#   Scoring
+#
+#       Guesses are scored over blocks of about ChunkSize patterns read straight from the mapped
+#       feedback table, so memory does not grow with the number of candidates.  log2(count) is
+#       kept in fixed point so guesses that split the candidates the same way get exactly the
+#       same score whatever order the buckets are added up in.
+#
+ChunkSize = 1 << 16
+LogScale = 1 << 32
+
+
+# -------------------------------------------------------------------------------------------------
+#   Entropy Solver
+#
+class EntropySolver:
+    """
+        Picks the guess with the highest expected information over the answers that are still
+        possible.
+
+        The candidates are an index array over the feedback matrix's word list.  Feedback prunes
+        it with a single row of the matrix and every guess is scored by counting how the
+        candidates fall into the 243 feedback buckets, so no strings are scored at all.  The
+        patterns are read from the memory mapped table in place, every process shares it.
+
+        The opening guess and the answer to every feedback on it are the same for every game.
+        They are worked out once and cached in an opening book next to the feedback table.
+    """
+
+    def __init__(
+            self,
+            feedback_matrix: FeedbackMatrix,
+            book_path: str | None = BookPath,
+            book: tuple[int, ...] | None = None
+    ):
+        self.matrix = feedback_matrix
+        self.candidates = array("I", range(feedback_matrix.size))
+        #
+        #   Guesses applied so far and the feedback on the first one, see next_guess
+        #
+        self.guesses: list[str] = []
+        self.first_feedback: tuple[int, int] | None = None
+        #
+        #   The engine and answer hint() last caught up with
+        #
+        self.engine = None
+        self.answer = None
+        #
+        #   Opening guess followed by the second guess for every pattern, loaded from (or
+        #   written to) <book_path> the first time it is needed unless <book> already is one.
+        #   A book_path of None keeps it in memory only
+        #
+        self.book_path = book_path
+        self.book = book
+
+        if numpy is not None:
+            #
+            #   A view of the mapped table, guess-major, plus log2(count) for every possible count
+            #
+            self.table = numpy.frombuffer(feedback_matrix.patterns, dtype=numpy.uint8).reshape(
+                feedback_matrix.size, feedback_matrix.size
+            )
+            counts = numpy.arange(feedback_matrix.size + 1)
+            self.log_count = numpy.rint(numpy.log2(numpy.maximum(counts, 1)) * LogScale).astype(numpy.int64)
+            self.count_log_count = counts * self.log_count
+
+    # ---------------------------------------------------------------------------------------------
+    #   Candidate Words
+    #
+    @property
+    def candidate_words(self) -> list[str]:
+        return [self.matrix.words[index] for index in self.candidates]
+
+    # ---------------------------------------------------------------------------------------------
+    #   New Game
+    #
+    def new_game(self):
+        self.candidates = array("I", range(self.matrix.size))
+        self.guesses = []
+        self.first_feedback = None
+        self.engine = None
+        self.answer = None
+
+    # ---------------------------------------------------------------------------------------------
+    #   Update
+    #
+    def update(self, guess: str, flags: list[int]):
+        """
+            Removes every candidate that would not have produced <flags> for <guess>
+        """
+        guess_index = self.matrix.index_of(guess)
+        if guess_index is None:
+            raise ValueError(f"{guess!r} is not in the solver's word list")
+
+        row = self.matrix.row(guess_index)
+        pattern = encode_flags(flags)
+        #
+        #   Compacted in place, kept candidates are moved to the front and the tail is dropped
+        #
+        candidates = self.candidates
+        kept = 0
+        for index in candidates:
+            if row[index] == pattern:
+                candidates[kept] = index
+                kept += 1
+
+        del candidates[kept:]
+
+        if not self.guesses:
+            self.first_feedback = (guess_index, pattern)
+        self.guesses.append(guess)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Next Guess
+    #
+    def next_guess(self) -> str:
+        if not self.candidates:
+            raise ValueError("No word in the list matches the feedback")
+
+        if len(self.candidates) <= 2:
+            return self.matrix.words[self.candidates[0]]
+
+        if len(self.candidates) == self.matrix.size:
+            return self.matrix.words[self.opening_book()[0]]
+        #
+        #   After the opening guess alone the answer is in the book
+        #
+        if len(self.guesses) == 1:
+            book = self.opening_book()
+            guess_index, pattern = self.first_feedback
+
+            if guess_index == book[0] and book[1 + pattern] != NoGuess:
+                return self.matrix.words[book[1 + pattern]]
+
+        return self.best_guess()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Hint
+    #
+    def hint(self, engine: WordleEngine) -> str:
+        """
+            Catches up with the guesses the engine has seen since the last call and returns the
+            suggested next guess.  Starts over when <engine> is playing another game: a
+            different engine or answer, or guesses other than the ones already applied.
+        """
+        applied = len(self.guesses)
+
+        if engine is not self.engine or engine.answer != self.answer or engine.guesses[:applied] != self.guesses:
+            self.new_game()
+            self.engine = engine
+            self.answer = engine.answer
+            applied = 0
+
+        for guess, flags in zip(engine.guesses[applied:], engine.feedback[applied:]):
+            self.update(guess, flags)
+
+        return self.next_guess()
+
+    # ---------------------------------------------------------------------------------------------
+    #   Opening Book
+    #
+    def opening_book(self) -> tuple[int, ...]:
+        if self.book is None:
+            if self.book_path is not None:
+                self.book = self.read_book(self.book_path)
+
+            if self.book is None:
+                self.book = self.build_book()
+
+                if self.book_path is not None:
+                    self.write_book(self.book_path)
+
+        return self.book
+
+    def build_book(self) -> tuple[int, ...]:
+        """
+            The solver's own choices: the best guess over every word, then the best guess over
+            each feedback bucket of it
+        """
+        saved = self.candidates, self.guesses
+        self.candidates = array("I", range(self.matrix.size))
+        self.guesses = []
+
+        try:
+            opening = self.matrix.index_of(self.best_guess())
+            row = self.matrix.row(opening)
+
+            buckets: dict[int, array] = {}
+            for index in range(self.matrix.size):
+                buckets.setdefault(row[index], array("I")).append(index)
+
+            second = [NoGuess] * PatternCount
+            for pattern, bucket in buckets.items():
+                self.candidates = bucket
+                second[pattern] = self.matrix.index_of(self.next_guess())
+        finally:
+            self.candidates, self.guesses = saved
+
+        return opening, *second
+
+    def read_book(self, path: str) -> tuple[int, ...] | None:
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        if len(data) != BookHeader.size + BookEntries.size:
+            return None
+
+        magic, version, size, digest = BookHeader.unpack_from(data)
+        if (magic, version, size) != (BookMagic, BookVersion, self.matrix.size):
+            return None
+
+        if digest != words_digest(self.matrix.words):
+            return None
+
+        return BookEntries.unpack_from(data, BookHeader.size)
+
+    def write_book(self, path: str):
+        """
+            Written to a temporary file and moved into place, see FeedbackMatrix.write_cache
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "wb") as file:
+            file.write(BookHeader.pack(BookMagic, BookVersion, self.matrix.size, words_digest(self.matrix.words)))
+            file.write(BookEntries.pack(*self.book))
+
+        os.replace(temp_path, path)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Best Guess
+    #
+    def best_guess(self) -> str:
+        """
+            Highest expected information wins, ties go to a word that can still be the answer
+        """
+        scores = self.expected_information()
+
+        if numpy is not None:
+            ties = numpy.flatnonzero(scores == scores.max()).tolist()
+        else:
+            top = max(scores)
+            ties = [index for index, value in enumerate(scores) if value == top]
+
+        best = next((index for index in ties if index in self.candidates), ties[0])
+        return self.matrix.words[best]
+
+    # ---------------------------------------------------------------------------------------------
+    #   Expected Information
+    #
+    def expected_information(self):
+        """
+            For every guess: log2(n) - sum(count * log2(count)) / n over the feedback buckets of
+            the n candidates
+        """
+        size = len(self.candidates)
+
+        if numpy is None:
+            scores = []
+            for guess_index in range(self.matrix.size):
+                row = self.matrix.row(guess_index)
+                buckets = Counter(row[index] for index in self.candidates)
+                scores.append(log2(size) - sum(count * log2(count) for count in buckets.values()) / size)
+            return scores
+
+        candidates = numpy.frombuffer(self.candidates, dtype=numpy.uint32).astype(numpy.intp)
+        rows = max(1, ChunkSize // size)
+        offsets = numpy.arange(rows, dtype=numpy.intp)[:, None] * PatternCount
+        weighted = numpy.empty(self.matrix.size, dtype=numpy.int64)
+
+        for start in range(0, self.matrix.size, rows):
+            patterns = self.table[start:start + rows, candidates]
+            count = len(patterns)
+            buckets = patterns + offsets[:count]
+            counts = numpy.bincount(buckets.ravel(), minlength=count * PatternCount)
+            #
+            #   With fewer candidates than buckets it is cheaper to add log2(count) once per
+            #   candidate than count * log2(count) once per bucket, the totals are the same
+            #
+            if size < PatternCount:
+                weighted[start:start + count] = self.log_count[counts[buckets]].sum(axis=1)
+            else:
+                weighted[start:start + count] = self.count_log_count[counts].reshape(count, PatternCount).sum(axis=1)
+
+        return numpy.log2(size) - weighted / (size * LogScale)
@@ -0,0 +1,38 @@
+import pygame as pg
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["GridIndex"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Grid Index
+#
+#       Buckets rectangles by the grid cells they overlap.  A hit test looks in the one cell under
+#       the point and checks the (one or two) rectangles in it, so finding the key under the mouse
+#       does not depend on how many keys there are.
+#
+class GridIndex:
+    def __init__(self, rects: list[pg.Rect], cell_size: int = 32):
+        self.cell_size = cell_size
+        self.rects = [pg.Rect(rect) for rect in rects]
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+        for index, rect in enumerate(self.rects):
+            for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(index)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Hit
+    #
+    def hit(self, pos) -> int | None:
+        """
+            Index of the rectangle under <pos>, or None
+        """
+        for index in self.cells.get((int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size), ()):
+            if self.rects[index].collidepoint(pos):
+                return index
+
+        return None
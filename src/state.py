@@ -4,16 +4,17 @@
 #
 #
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from enum import IntEnum
 import pygame as pg
 
 from src.assets.templates import splash_logo_template
 from src.assets.templates import splash_logo_shadow_template
-from src.assets.templates import game_button_template
-from src.button import Button
+from src.button import nav_button
 from src.event_handler import NavButtonMouseOverHandler
 from src.event_handler import NavButtonMouseUpHandler
+from src.frame_profiler import frame_profiler
+from src.image_cache import ImageCache
+from src.layer import StaticLayer
 from src.text import TextBuilder
 
 import src.assets.definitions as df
@@ -84,12 +85,7 @@ class InitialGameState(State):
     #
     @staticmethod
     def initialize_logo():
-        if not pg.get_init():
-            pg.init()
-        init_logo = pg.image.load(df.splash_screen_logo)
-        resized_logo = pg.transform.scale(init_logo, (400, 400))
-
-        return resized_logo
+        return ImageCache.get(df.splash_screen_logo, df.SplashLogoSize)
     # ---------------------------------------------------------------------------------------------
     #   Initialize Buttons
     #
@@ -97,14 +93,13 @@ class InitialGameState(State):
         buttons = []
 
         for index, label in enumerate(self.button_names):
-            button = Button()
-            button_template = deepcopy(game_button_template)
-            button_template['x'] = self.button_coords[index][Index.xCoord]
-            button_template['y'] = self.button_coords[index][Index.yCoord]
-            button_template['label'] = label
-            button.build(button_template)
-
-            buttons.append(button)
+            buttons.append(
+                nav_button.clone(
+                    x=self.button_coords[index][Index.xCoord],
+                    y=self.button_coords[index][Index.yCoord],
+                    label=label
+                )
+            )
 
         return buttons
 
@@ -130,9 +125,9 @@ class InitialGameState(State):
     def handle_mouse_over(self, *args, **kwargs):
         for button in self.buttons:
             if button.button_rectangle.collidepoint(args[Index.MousePos]):
-                button.button_color = df.ButtonMouseOverColor
+                button.set_button_color(df.ButtonMouseOverColor)
             else:
-                button.button_color = df.ButtonBgColor
+                button.set_button_color(df.ButtonBgColor)
 
     # -------------------------------------------------------------------------------------------------
     #   Mouse Up Event Handler
@@ -163,10 +158,15 @@ class InitialGameState(State):
         logo_rect = self.logo.get_rect()
         logo_rect.center = (df.ScreenWidth/2, (df.ScreenHeight/2) - 100)
 
+        canvas.fill(df.BgColor)
+        frame_profiler.mark("background")
+
         for button in self.buttons:
             button.draw(canvas)
+        frame_profiler.mark("buttons")
 
         canvas.blit(self.logo, logo_rect)
+        frame_profiler.mark("logo")
 
 
 # -------------------------------------------------------------------------------------------------
@@ -190,6 +190,11 @@ class PlayGameState(State):
     def __init__(self):
         self.name = "Play"
         self.buttons = self.initialize_buttons()
+        # -----------------------------------------------------------------------------------------
+        #   Background, board grid outlines and button borders, see draw_static
+        #
+        self.board = None
+        self.background = StaticLayer(self.draw_static)
 
     # ---------------------------------------------------------------------------------------------
     #   Initialize Buttons
@@ -198,14 +203,13 @@ class PlayGameState(State):
         buttons = []
 
         for index, label in enumerate(self.button_names):
-            button = Button()
-            button_template = deepcopy(game_button_template)
-            button_template['x'] = self.buttons_coords[index][Index.xCoord]
-            button_template['y'] = self.buttons_coords[index][Index.yCoord]
-            button_template['label'] = label
-            button.build(button_template)
-
-            buttons.append(button)
+            buttons.append(
+                nav_button.clone(
+                    x=self.buttons_coords[index][Index.xCoord],
+                    y=self.buttons_coords[index][Index.yCoord],
+                    label=label
+                )
+            )
 
         return buttons
 
@@ -215,9 +219,9 @@ class PlayGameState(State):
     def handle_mouse_over(self, *args, **kwargs):
         for button in self.buttons:
             if button.button_rectangle.collidepoint(args[Index.MousePos]):
-                button.button_color = df.ButtonMouseOverColor
+                button.set_button_color(df.ButtonMouseOverColor)
             else:
-                button.button_color = df.ButtonBgColor
+                button.set_button_color(df.ButtonBgColor)
 
     # ---------------------------------------------------------------------------------------------
     #   Mouse Up Event Handler
@@ -233,6 +237,24 @@ class PlayGameState(State):
     def handle_subscriptions(self, state_manager):
         pass
 
+    # ---------------------------------------------------------------------------------------------
+    #   Draw Static
+    #
+    def draw_static(self, surface):
+        """
+        Draws everything that does not change after Board.build onto the static layer
+        """
+        for button in self.buttons:
+            button.draw_border(surface)
+
+        for rectangle in self.board.tiles:
+            pg.draw.rect(
+                surface,
+                rectangle.color,
+                rectangle.rectangle,
+                rectangle.thickness
+            )
+
     # ---------------------------------------------------------------------------------------------
     #   Render all State Assets
     #
@@ -250,39 +272,36 @@ class PlayGameState(State):
         keyboard = args[RenderArgs.StateManager].keyboard
         word_manager = args[RenderArgs.StateManager].word_manager
         # -----------------------------------------------------------------------------------------
+        #   Background, button borders and the Wordle game board grid
+        #
+        self.board = board
+        canvas.blit(self.background.get(board.layout), (0, 0))
+        frame_profiler.mark("board")
+        # -----------------------------------------------------------------------------------------
         #   Render State Specific Buttons
         #
         for button in self.buttons:
-            button.draw(canvas)
+            button.draw_face(canvas)
+        frame_profiler.mark("buttons")
         # -----------------------------------------------------------------------------------------
-        #   Draw the Wordle game board
+        #   Draw colored tiles on the Wordle game board after each guess
         #
-        for rectangle in board.tiles:
+        for index in range(board.guess_count):
+            tile = board.guess_tiles[index]
             pg.draw.rect(
                 canvas,
-                rectangle.color,
-                rectangle.rectangle,
-                rectangle.thickness
+                tile.color,
+                tile.rectangle,
+                tile.thickness
             )
-        # -----------------------------------------------------------------------------------------
-        #   Draw colored tiles on the Wordle game board after each guess
-        #
-        if board.guess_tiles:
-            for tile in board.guess_tiles:
-                pg.draw.rect(
-                    canvas,
-                    tile.color,
-                    tile.rectangle,
-                    tile.thickness
-                )
+        frame_profiler.mark("guess tiles")
         # ------------------------------------------------------------------------------------------
         #   Draw letters on Wordle board
         #
         # if self.word_manager.renderable_letters:
-        for index, letter in enumerate(word_manager.renderable_letters):
-            letter.rectangle.center = board.tiles[index].rectangle.center
-
-            canvas.blit(letter.renderable_text_object, letter.rectangle)
+        for index, glyph in enumerate(word_manager.renderable_letters):
+            canvas.blit(glyph, glyph.get_rect(center=board.tiles[index].rectangle.center))
+        frame_profiler.mark("letters")
         # ------------------------------------------------------------------------------------------
         #   Render Game Keypad
         #
@@ -324,6 +343,7 @@ class PlayGameState(State):
                     keyboard.letters[df.BackspaceKeyIndex].renderable_text_object,
                     keyboard.letters[df.BackspaceKeyIndex].rectangle
                 )
+        frame_profiler.mark("keypad")
 
 
 # ---------------------------------------------------------------------------------------------------
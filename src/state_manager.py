@@ -1,8 +1,11 @@
+from functools import partial
+
 import pygame as pg
 
 from src.assets.definitions import alpha_keymap
 
 from src.button import NavButtonManager
+from src.dirty_regions import dirty_regions
 from src.word_manager import WordManager
 
 from src.board import Board
@@ -26,6 +29,7 @@ from src.event_handler import KeyboardBackspaceHandler
 from src.event_handler import NavButtonMouseOverHandler
 from src.event_handler import NavButtonMouseUpHandler
 
+from src.state import State
 from src.state import InitialGameState
 from src.state import PlayGameState
 
@@ -37,11 +41,12 @@ __all__ = ["StateManager"]
 #
 class StateManager:
     # -------------------------------------------------------------------------------------------------
-    #
+    #   State factories, each state is built the first time it is transitioned to (see get_state)
+    #   so importing the state manager does not load any assets
     #
     states = {
-        "Initial": InitialGameState(),
-        "Play": PlayGameState(),
+        "Initial": InitialGameState,
+        "Play": PlayGameState,
     }
 
     transition_rules = {
@@ -54,16 +59,25 @@ class StateManager:
     # -------------------------------------------------------------------------------------------------
     #
     #
-    def __init__(self, canvas, event_manager):
+    def __init__(self, canvas, event_manager, scheduler=None, answer_deck=None):
         self.cur_state = None
+        self.built_states: dict[str, State] = {}
+        #
+        #   state or action --> ((event type, handler), ...) it subscribes, see subscriptions
+        #
+        self.handlers: dict[str, tuple] = {}
 
         self.canvas = canvas
         self.event_manager = event_manager
+        #
+        #   FrameScheduler the Play assets are loaded on while the splash screen is shown
+        #
+        self.scheduler = scheduler
 
         self.tiles = Board()
         self.keyboard = Keyboard()
         self.nav_button_manager = NavButtonManager()
-        self.word_manager = WordManager(self.tiles, self.keyboard)
+        self.word_manager = WordManager(self.tiles, self.keyboard, answer_deck=answer_deck)
 
         self.add_letter_command = AddLetterCommand(self.word_manager)
         self.keypad_remove_letter_command = RemoveLetterCommand(self.word_manager)
@@ -78,6 +92,17 @@ class StateManager:
             ]
         )
 
+    # -------------------------------------------------------------------------------------------------
+    #   Get State
+    #
+    def get_state(self, state: str) -> State:
+        built_state = self.built_states.get(state)
+
+        if built_state is None:
+            built_state = self.built_states[state] = self.states[state]()
+
+        return built_state
+
     # -------------------------------------------------------------------------------------------------
     #   Set Initial State
     #
@@ -89,24 +114,45 @@ class StateManager:
     #   Transition To
     #
     def transition_to(self, state: str):
+        previous_state = self.cur_state
         #
         #   This handles the first call to transition_to from set_initial_state
         #
         if not self.cur_state:
-            self.cur_state = self.states[state]
+            self.cur_state = self.get_state(state)
 
         elif state in self.states and state in self.transition_rules[self.cur_state.name]:
-            self.cur_state = self.states[state]
+            self.cur_state = self.get_state(state)
+        #
+        #   Handlers live as long as the state they were subscribed in
+        #
+        if previous_state is not None and previous_state is not self.cur_state:
+            self.event_manager.release(previous_state.name)
 
         self.handle_state_specific_actions(state)
+        dirty_regions.mark_all()
 
     # -------------------------------------------------------------------------------------------------
     #   Handle State Specific Actions
     #
     def handle_state_specific_actions(self, state: str):
-        if state == "Initial":
-            self.event_manager.subscribe(pg.MOUSEBUTTONUP, NavButtonMouseUpHandler(self))
-            self.event_manager.subscribe(pg.MOUSEMOTION, NavButtonMouseOverHandler(self))
+        #
+        #   Subscriptions made here are scoped to the current state and released when it is
+        #   left.  "Start" and "New" are actions within the Play state, so pressing Start again
+        #   finds its handlers already subscribed and the subscriptions are refused.
+        #
+        scope = self.cur_state.name
+
+        if state in self.states:
+            self.subscribe(state, scope)
+
+        if state == "Initial" and self.scheduler is not None:
+            #
+            #   Build the Play screen while the player looks at the splash screen
+            #
+            self.scheduler.defer(partial(self.get_state, "Play"))
+            self.scheduler.defer(self.tiles.build)
+            self.scheduler.defer(self.keyboard.build)
 
         if state == "Play":
             self.tiles.build()
@@ -114,61 +160,93 @@ class StateManager:
 
         elif state == "Start":
             self.word_manager.set_wordle_word()
-            # -------------------------------------------------------------------------------------
-            #   Initialize Keyboard Command Handlers
-            #
-            keyboard_keypress_handler = KeyboardKeyPressHandler(self.add_letter_command)
-            keyboard_return_handler = KeyboardReturnHandler(self.validate_word_command)
-            keyboard_backspace_handler = KeyboardBackspaceHandler(self.keyboard_remove_letter_command)
+            self.subscribe(state, scope)
 
-            # -------------------------------------------------------------------------------------
-            #   Initialize Keypad Command Handlers
-            #
-            game_keypad_motion_handler = GameKeypadMouseMotionHandler(self.keyboard)
+        elif state == "New":
+            self.new_game_command.execute()
 
-            game_keypad_mouseup_handler = GameKeypadMouseUpHandler(
-                self.keyboard,
-                self.add_letter_command
-            )
+        elif state == "Quit":
+            self.quit_game_command.execute()
 
-            game_keypad_return_handler = GameKeypadReturnHandler(
-                self.keyboard,
-                self.validate_word_command
-            )
+        else:
+            pass
 
-            game_keypad_backspace_handler = GameKeypadBackspaceHandler(
-                self.keyboard,
-                self.keypad_remove_letter_command
+    # -------------------------------------------------------------------------------------------------
+    #   Subscribe
+    #
+    def subscribe(self, name: str, scope: str):
+        for event_type, handler in self.subscriptions(name):
+            self.event_manager.subscribe(event_type, handler, scope)
+
+    # -------------------------------------------------------------------------------------------------
+    #   Subscriptions
+    #
+    def subscriptions(self, name: str) -> tuple:
+        """
+            (event type, handler) pairs subscribed by the state or action <name>.  The handlers
+            are created the first time and the same objects are subscribed every time after
+        """
+        subscriptions = self.handlers.get(name)
+
+        if subscriptions is None:
+            subscriptions = self.handlers[name] = self.create_handlers(name)
+
+        return subscriptions
+
+    # -------------------------------------------------------------------------------------------------
+    #   Create Handlers
+    #
+    def create_handlers(self, name: str) -> tuple:
+        if name in self.states:
+            return (
+                (pg.MOUSEBUTTONUP, NavButtonMouseUpHandler(self)),
+                (pg.MOUSEMOTION, NavButtonMouseOverHandler(self)),
             )
 
+        if name != "Start":
+            return ()
+        # -----------------------------------------------------------------------------------------
+        #   Initialize Keyboard Command Handlers
+        #
+        keyboard_keypress_handler = KeyboardKeyPressHandler(self.add_letter_command)
+        keyboard_return_handler = KeyboardReturnHandler(self.validate_word_command)
+        keyboard_backspace_handler = KeyboardBackspaceHandler(self.keyboard_remove_letter_command)
+
+        # -----------------------------------------------------------------------------------------
+        #   Initialize Keypad Command Handlers
+        #
+        game_keypad_motion_handler = GameKeypadMouseMotionHandler(self.keyboard)
+
+        game_keypad_mouseup_handler = GameKeypadMouseUpHandler(
+            self.keyboard,
+            self.add_letter_command
+        )
+
+        game_keypad_return_handler = GameKeypadReturnHandler(
+            self.keyboard,
+            self.validate_word_command
+        )
+
+        game_keypad_backspace_handler = GameKeypadBackspaceHandler(
+            self.keyboard,
+            self.keypad_remove_letter_command
+        )
+
+        return (
             # -------------------------------------------------------------------------------------
-            #   Subscriptions
-            #
-            # -------------------------------------------------------------------------------------
-            #   Sub all keys from A - Z
+            #   All keys from A - Z
             #
-            for event in alpha_keymap.values():
-                self.event_manager.subscribe(event, keyboard_keypress_handler)
+            *((event, keyboard_keypress_handler) for event in alpha_keymap.values()),
             # -------------------------------------------------------------------------------------
             #   Keyboard specific handlers
             #
-            self.event_manager.subscribe(pg.KEYDOWN, keyboard_keypress_handler)
-            self.event_manager.subscribe(pg.K_RETURN, keyboard_return_handler)
-            self.event_manager.subscribe(pg.K_BACKSPACE, keyboard_backspace_handler)
+            (pg.K_RETURN, keyboard_return_handler),
+            (pg.K_BACKSPACE, keyboard_backspace_handler),
             # -------------------------------------------------------------------------------------
             #   Keypad specific handlers
             #
-            self.event_manager.subscribe(pg.MOUSEMOTION, game_keypad_motion_handler)
-            self.event_manager.subscribe(pg.MOUSEBUTTONUP, game_keypad_mouseup_handler)
-            self.event_manager.subscribe(pg.MOUSEBUTTONUP, game_keypad_return_handler)
-            self.event_manager.subscribe(pg.MOUSEBUTTONUP, game_keypad_backspace_handler)
-
-
-        elif state == "New":
-            self.new_game_command.execute()
-
-        elif state == "Quit":
-            self.quit_game_command.execute()
-
-        else:
-            pass
+            (pg.MOUSEMOTION, game_keypad_motion_handler),
+            (pg.MOUSEBUTTONUP, game_keypad_mouseup_handler),
+            (pg.MOUSEBUTTONUP, game_keypad_return_handler),
+            (pg.MOUSEBUTTONUP, game_keypad_backspace_handler),
+        )
@@ -0,0 +1,125 @@
+from abc import ABC, abstractmethod
+from random import Random
+
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix, encode_flags, score
+from src.solver import EntropySolver
+
+import src.wordle_words as words
+
+# -------------------------------------------------------------------------------------------------
+#
+#
+__all__ = ["Strategy", "FirstCandidateStrategy", "RandomCandidateStrategy", "EntropyStrategy", "strategies"]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Strategy Abstract Base Class
+#
+class Strategy(ABC):
+    """
+        Chooses guesses for a WordleEngine.  new_game is called before the first guess of each
+        game, next_guess reads the engine's guesses and feedback and returns a lower case word.
+    """
+
+    def new_game(self):
+        pass
+
+    @abstractmethod
+    def next_guess(self, engine: WordleEngine) -> str:
+        pass
+
+
+# -------------------------------------------------------------------------------------------------
+#   Candidate Strategy
+#
+class CandidateStrategy(Strategy, ABC):
+    """
+        Keeps the indices of the words that are still consistent with every piece of feedback
+        so far.  When the engine has a feedback matrix over the same word list the candidates are
+        pruned with a row of the matrix instead of scoring every word again.
+    """
+
+    def __init__(self, word_list=words.all_words):
+        self.word_list = word_list
+        self.words = [word.lower() for word in word_list]
+        self.candidates: list[int] = []
+
+    def new_game(self):
+        self.candidates = list(range(len(self.words)))
+
+    def prune(self, engine: WordleEngine):
+        if not engine.guesses:
+            return
+
+        guess = engine.guesses[-1].lower()
+        pattern = encode_flags(engine.feedback[-1])
+        matrix = engine.feedback_matrix
+
+        if matrix is not None and matrix.words is self.word_list:
+            row = matrix.row(matrix.index_of(guess))
+            self.candidates = [index for index in self.candidates if row[index] == pattern]
+        else:
+            self.candidates = [index for index in self.candidates if score(guess, self.words[index]) == pattern]
+
+
+# -------------------------------------------------------------------------------------------------
+#   First Candidate Strategy
+#
+class FirstCandidateStrategy(CandidateStrategy):
+    """
+        Guesses the first word still in play.  The word list is ordered by how common the
+        words are, so this favours common words.
+    """
+
+    def next_guess(self, engine: WordleEngine) -> str:
+        self.prune(engine)
+        return self.words[self.candidates[0]]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Random Candidate Strategy
+#
+class RandomCandidateStrategy(CandidateStrategy):
+
+    def __init__(self, word_list=words.all_words, seed: int | None = None):
+        super().__init__(word_list)
+        self.rng = Random(seed)
+
+    def next_guess(self, engine: WordleEngine) -> str:
+        self.prune(engine)
+        return self.words[self.rng.choice(self.candidates)]
+
+
+# -------------------------------------------------------------------------------------------------
+#   Entropy Strategy
+#
+class EntropyStrategy(Strategy):
+    """
+        Asks an EntropySolver for a hint.  The solver reads the cached feedback matrix in place,
+        so its pages are shared between processes, and takes the first two guesses of every
+        game from the cached opening book.
+    """
+
+    def __init__(self, word_list=words.all_words, book: tuple[int, ...] | None = None):
+        """
+            <book> is an opening book already worked out for <word_list>, see
+            EntropySolver.opening_book
+        """
+        self.solver = EntropySolver(FeedbackMatrix.load(word_list), book=book)
+
+    def new_game(self):
+        self.solver.new_game()
+
+    def next_guess(self, engine: WordleEngine) -> str:
+        return self.solver.hint(engine)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Strategies by name, used by the simulator command line
+#
+strategies: dict[str, type[Strategy]] = {
+    "first": FirstCandidateStrategy,
+    "random": RandomCandidateStrategy,
+    "entropy": EntropyStrategy,
+}
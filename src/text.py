@@ -1,6 +1,6 @@
 from src.assets.definitions import main_font
+from src.fonts import FontRegistry, GlyphAtlas
 from enum import IntEnum
-import pygame as pg
 
 
 # -------------------------------------------------------------------------------------------------
@@ -63,24 +63,48 @@ class TextSetter:
 # -------------------------------------------------------------------------------------------------
 #   Text Class
 #
+#       Slotted like Rectangle
+#
 class Text:
+    __slots__ = (
+        "_label", "_color", "_size", "_antialias", "_pos", "_font_family", "_font_object",
+        "_renderable_text_object", "_rectangle"
+    )
+
     def __init__(self, setter: TextSetter):
+        self.setup(setter.label, setter.color, setter.size, setter.antialias, setter.font_family, setter.pos)
+
+    # ---------------------------------------------------------------------------------------------
+    #   Create
+    #
+    #       Builds a text straight from its values, used by compiled templates (see prototype.py)
+    #
+    @classmethod
+    def create(cls, label=None, color=None, size=None, antialias=None, font_family=None, pos=None):
+        text = cls.__new__(cls)
+        text.setup(label, color, size, antialias, font_family, pos)
+
+        return text
+
+    # ---------------------------------------------------------------------------------------------
+    #   Setup
+    #
+    def setup(self, label, color, size, antialias, font_family, pos):
         # SETTER
-        self._label = setter.label
-        self._color = setter.color
-        self._size = setter.size
-        self._antialias = setter.antialias
+        self._label = label
+        self._color = color
+        self._size = size
+        self._antialias = antialias
         #
-        self._pos = setter.pos
+        self._pos = pos
         # IMPORTED
-        if not setter.font_family:
+        if not font_family:
             self._font_family = main_font
         else:
-            self._font_family = setter.font_family
+            self._font_family = font_family
         # COMPUTED
-        pg.font.init()
-        self._font_object = pg.font.Font(self._font_family, self._size)
-        self._renderable_text_object = self._font_object.render(self._label, self._antialias, self._color)
+        self._font_object = FontRegistry.get(self._font_family, self._size)
+        self._renderable_text_object = self.get_glyph()
         self._rectangle = self._renderable_text_object.get_rect()
 
     # ---------------------------------------------------------------------------------------------
@@ -139,14 +163,18 @@ class Text:
     def rectangle(self, rectangle):
         self._rectangle = rectangle
 
+    # ---------------------------------------------------------------------------------------------
+    #   Get Glyph
+    #
+    def get_glyph(self):
+        return GlyphAtlas.get(self._label, self._font_family, self._size, self._antialias, self._color)
+
     # ---------------------------------------------------------------------------------------------
     #   Update Renderable
     #
     def update_renderable(self):
-        self._font_object = pg.font.Font(self._font_family, self._size)
-        self._renderable_text_object = self._font_object.render(
-            self._label, self._antialias, self._color
-        )
+        self._font_object = FontRegistry.get(self._font_family, self._size)
+        self._renderable_text_object = self.get_glyph()
         self._rectangle = self._renderable_text_object.get_rect()
 
     # ---------------------------------------------------------------------------------------------
@@ -154,9 +182,7 @@ class Text:
     #
     def update_renderable_text_object(self, label: str):
         self._label = label
-        self._font_object = pg.font.Font(self._font_family, self._size)
-        self._renderable_text_object = self._font_object.render(self._label, self._antialias, self._color)
-        self._rectangle = self._renderable_text_object.get_rect()
+        self.update_renderable()
 
 
 # -------------------------------------------------------------------------------------------------
@@ -1,11 +1,13 @@
-from copy import deepcopy
-from random import choice
+from src.answer_deck import AnswerDeck
 from src.board import Board
 from src.commands import UpdateBoardAfterReturn
 from src.commands import UpdateKeypadAfterReturn
 from src.commands import SetFlagsAndLetters
+from src.dirty_regions import dirty_regions
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix
+from src.fonts import GlyphAtlas
 from src.keyboard import Keyboard
-from src.text import TextBuilder
 
 import src.assets.definitions as df
 import src.assets.templates as tpl
@@ -19,29 +21,45 @@ __all__=["WordManager"]
 #
 class WordManager:
     """
-
+        Pygame view over a WordleEngine.  The engine owns the answer, the letters and the
+        guesses; the Word Manager keeps the renderable letters in step with it and sends the
+        board and keypad commands after each accepted guess.
     """
 
-    # ---------------------------------------------------------------------------------------------
-    #   Prevents the possibility of getting the same word during a series of games
-    #
-    prior_words_to_find = []
-
-
-    def __init__(self, board: Board, keypad: Keyboard):
+    def __init__(
+        self,
+        board: Board,
+        keypad: Keyboard,
+        feedback_matrix: FeedbackMatrix | None = None,
+        answer_deck: AnswerDeck | None = None
+    ):
+        # -----------------------------------------------------------------------------------------
+        #   Prevents the possibility of getting the same word during a series of games, pass a
+        #   seeded deck for a repeatable series
+        #
+        if answer_deck is None:
+            answer_deck = AnswerDeck(words.all_words)
+        self.answer_deck = answer_deck
+        # -----------------------------------------------------------------------------------------
+        #   Game logic
+        #
+        self.engine = WordleEngine(self.answer_deck, feedback_matrix)
         # -----------------------------------------------------------------------------------------
-        #   Randomly chosen word from words.json
+        #   Tiles the letters are drawn on, used to mark the tile that changed
         #
-        self.wordle_word = None
+        self.board = board
         # -----------------------------------------------------------------------------------------
-        #   List of the current set of letters chosen by the user
-        #   List of words chosen by the user
-        #   List of renderable letters corresponding to each chosen word
+        #   List of renderable letters (glyph surfaces from the atlas) corresponding to each
+        #   chosen word, drawn in the board font
         #
-        self.chosen_letters = []
-        self.chosen_words = []
         self.renderable_letters = []
-        self.text_builder = TextBuilder()
+        self.letter_style = (
+            df.main_font,
+            tpl.board_font_template["size"],
+            tpl.board_font_template["antialias"],
+            tpl.board_font_template["color"]
+        )
+        GlyphAtlas.preload(df.qwerty, *self.letter_style)
         # -----------------------------------------------------------------------------------------
         #   Commands
         #
@@ -49,160 +67,107 @@ class WordManager:
         self.update_keypad_command = UpdateKeypadAfterReturn(keypad)
         self.set_flags_and_letters_command = SetFlagsAndLetters(keypad)
 
-        self.curCol = 0
         self.curRectIndex = 0
-        self.game_over = False
+    # ---------------------------------------------------------------------------------------------
+    #   Engine State
+    #
+    @property
+    def wordle_word(self) -> str:
+        return self.engine.answer
+
+    @property
+    def chosen_letters(self) -> list[str]:
+        return self.engine.letters
+
+    @property
+    def chosen_words(self) -> list[str]:
+        return self.engine.guesses
+
+    @property
+    def curCol(self) -> int:
+        return len(self.engine.letters)
+
+    @property
+    def game_over(self) -> bool:
+        return self.engine.game_over
     # ---------------------------------------------------------------------------------------------
     #   New Game
     #
     def new_game(self):
         """
-            Resets instance attributes and retrieves a new Wordle Word.
-                1- Clears chosen letters
-                2- Clears chosen words
-                3- Clears renderable letters
-                4- Sets current column to 0
-                5- Sets current rectangle index to 0
-                6- Sets game over to false
+            Starts a new game in the engine and resets the view.
+                1- Clears renderable letters
+                2- Sets current rectangle index to 0
         """
-        self.set_wordle_word()
-        self.chosen_letters.clear()
-        self.chosen_words.clear()
+        self.engine.new_game()
         self.renderable_letters.clear()
-        self.curCol = 0
         self.curRectIndex = 0
-        self.game_over = False
     # ---------------------------------------------------------------------------------------------
     # Set Wordle Word
     #
     def set_wordle_word(self):
         """
-            Randomly choose a new Wordle Word and append this word
-            to the list of words that have already been chosen.
+            Deal the next Wordle Word from the answer deck.  No word
+            repeats until every word in the list has been dealt.
         """
-        chosen = choice(words.all_words)
-
-        if chosen not in self.prior_words_to_find:
-            self.prior_words_to_find.append(chosen)
-        else:
-            self.set_wordle_word()
-
-        self.wordle_word = chosen.upper()
+        self.engine.set_answer()
     # ---------------------------------------------------------------------------------------------
     #   Add Letter
     #
     def add_letter(self, letter: str):
         """
             Takes user input and adds the current chosen letter to the
-            chosen letters list as well as creates a renderable version of
-            the letter and adds it to the renderable letter list.
+            engine as well as creates a renderable version of the letter
+            and adds it to the renderable letter list.
         """
-
-        print(len(self.chosen_letters))
-        if len(self.chosen_letters) < df.MaxLetters:
-            # -------------------------------------------------------------------------------------
-            #   Add <letter> to the current list of chosen letters
-            #
-            self.chosen_letters.append(letter)
+        if self.engine.add_letter(letter):
             # -------------------------------------------------------------------------------------
-            #   Use <letter> to create a renderable text object
+            #   The renderable version of <letter> is shared from the glyph atlas
             #
-            new_letter = deepcopy(tpl.board_font_template)
-            new_letter["label"] = letter
-            self.renderable_letters.append(self.text_builder.build(new_letter))
+            self.renderable_letters.append(GlyphAtlas.get(letter, *self.letter_style))
 
+            dirty_regions.mark(self.board.tiles[self.curRectIndex].rectangle)
             self.curRectIndex += 1
-            self.curCol += 1
-
-        print(len(self.chosen_letters))
-
     # ---------------------------------------------------------------------------------------------
     #   Remove Letter
     #
     def remove_letter(self):
         """
             Corresponds to backspace key and removes a single letter from
-            the chosen letter and renderable letters lists.
+            the engine and the renderable letters list.
         """
-        if len(self.chosen_letters) > 0:
-            self.chosen_letters.pop()
+        if self.engine.remove_letter():
             self.renderable_letters.pop()
             self.curRectIndex -= 1
-            self.curCol -= 1
+            dirty_regions.mark(self.board.tiles[self.curRectIndex].rectangle)
     # ---------------------------------------------------------------------------------------------
     #   Validate
     #
     def validate(self):
         """
-            Only perform validation if the user has entered all 5 letters
+            Only updates the board and keypad when the engine accepts the
+            guess, i.e., all 5 letters are entered and the word is in the
+            Wordle word list.  Otherwise the letters stay on the board so
+            the user can correct them.
         """
-        if not self.game_over:
-            if self.curCol == 5:
-                #   TODO --> add function to check if the word entered is defined in wordle word list
-                #
-                flags = self.get_flags()
-                # ---------------------------------------------------------------------------------
-                #   Command --> Board.update_board
-                #   Command --> Keyboard.update_keypad
-                #
-                self.update_board_command.execute(flags)
-                self.set_flags_and_letters_command.execute(flags, self.chosen_letters)
-                self.update_keypad_command.execute()
-                # ---------------------------------------------------------------------------------
-                #
-                #
-                if all(list(map(lambda x: x == 1, flags))):
-                    # -----------------------------------------------------------------------------
-                    #   All flags == 1 --> the correct word was found now end the game with a
-                    #   congrats message
-                    #
-                    self.game_over = True
+        letters = list(self.engine.letters)
+        flags = self.engine.submit()
 
-                elif self.curRectIndex == 29:
-                    # -----------------------------------------------------------------------------
-                    #   This occurs when the user has reached row 6, has entered 5 letters and
-                    #   pressed return.  Since the above condition was not met (i.e., all flags == 1),
-                    #   then it follows that the final word entered is NOT the correct word and the
-                    #   user has lost the game.
-                    self.game_over = True
-
-                else:
-                    self.chosen_words.append("".join(self.chosen_letters))
-                    self.chosen_letters.clear()
-                    self.curCol = 0
-    # ---------------------------------------------------------------------------------------------
-    #   Find Occurrences
-    #
-    @staticmethod
-    def find_occurrences(char: str, word: list[str]) -> list[int]:
-        return [index for (index, char_in_word) in enumerate(word) if char == char_in_word]
+        if flags is not None:
+            # -------------------------------------------------------------------------------------
+            #   Command --> Board.update_board
+            #   Command --> Keyboard.update_keypad
+            #
+            self.update_board_command.execute(flags)
+            self.set_flags_and_letters_command.execute(flags, letters)
+            self.update_keypad_command.execute()
     # ---------------------------------------------------------------------------------------------
-    #   Find Indices
+    #   Is Valid Word
     #
-    @staticmethod
-    def find_indices(item, lst):
-        return [index for index, val in enumerate(lst) if val == item ]
+    def is_valid_word(self) -> bool:
+        return self.engine.is_valid_word("".join(self.engine.letters))
     # ---------------------------------------------------------------------------------------------
     #   Get Flags
     #
     def get_flags(self) -> list[int]:
-        found = []
-        flags = [df.InvalidPos, df.InvalidPos, df.InvalidPos, df.InvalidPos, df.InvalidPos,]
-        w_word = list(self.wordle_word)
-
-        for index, (char_in_guess, char_in_word) in enumerate(zip(self.chosen_letters, w_word)):
-            if char_in_guess == char_in_word:
-                flags[index] = df.ValidCorrectPos
-                found.append(index)
-
-        for index, char in enumerate(self.chosen_letters):
-            if char in w_word and flags[index] != df.ValidCorrectPos:
-                occurrences = self.find_occurrences(char, w_word)
-
-                for pos in occurrences:
-                    if pos not in found:
-                        flags[index] = df.ValidIncorrectPos
-                        found.append(pos)
-                        break
-
-        return flags
+        return self.engine.get_flags(self.engine.letters, self.engine.answer)
@@ -0,0 +1,233 @@
+from argparse import ArgumentParser, SUPPRESS
+from datetime import datetime, timezone
+from importlib import import_module
+from statistics import median
+from time import perf_counter_ns
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+# -------------------------------------------------------------------------------------------------
+#   Startup Benchmark
+#
+#       Launches the game in fresh processes with the dummy video driver and times each phase
+#       from process start to the first presented Initial frame and on to the first Play frame.
+#       The parent process reads the clock right before starting each child, perf_counter is
+#       a system wide monotonic clock so the child can measure from that moment.
+#
+#           cold    the image cache is removed before every launch
+#           warm    the caches are left in place (one launch fills them first)
+#
+#       Medians are appended to a JSON history file and compared against the previous entry of
+#       the same mode.
+#
+History = "startup_history.json"
+Modes = ("cold", "warm")
+
+
+# -------------------------------------------------------------------------------------------------
+#   Phases
+#
+class Phases:
+    """
+        Consecutive laps, font loading is timed wherever it happens and taken out of the phase
+        it happened in so the phases add up to the total
+    """
+    def __init__(self, started: int):
+        self.started = started
+        self.last = started
+        self.fonts = 0
+        self.fonts_at_last = 0
+        self.laps: dict[str, float] = {}
+
+    def lap(self, name: str):
+        now = perf_counter_ns()
+        self.laps[name] = (now - self.last - (self.fonts - self.fonts_at_last)) / 1_000_000
+        self.last = now
+        self.fonts_at_last = self.fonts
+
+    def since_start(self) -> float:
+        return (perf_counter_ns() - self.started) / 1_000_000
+
+    def timed_fonts(self, font_class):
+        def load_font(*args):
+            start = perf_counter_ns()
+            font = font_class(*args)
+            self.fonts += perf_counter_ns() - start
+            return font
+
+        return load_font
+
+
+# -------------------------------------------------------------------------------------------------
+#   Launch (child process)
+#
+def launch(started: int) -> dict:
+    phases = Phases(started)
+    #
+    #   Interpreter start up and the imports of this script
+    #
+    phases.lap("interpreter")
+
+    import pygame as pg
+    phases.lap("import pygame")
+
+    pg.font.Font = phases.timed_fonts(pg.font.Font)
+
+    import_module("src.wordle_words")
+    phases.lap("import word list")
+
+    from src.dirty_regions import dirty_regions
+    from src.game import Game
+    phases.lap("import game")
+
+    pg.init()
+    phases.lap("pg.init")
+
+    game = Game()
+    phases.lap("Game()")
+
+    game.initialize()
+    phases.lap("initialize")
+
+    game.redraw(dirty_regions.take(game.canvas.get_rect()))
+    phases.lap("first Initial frame")
+    first_initial_frame = phases.since_start()
+
+    game.state_manager.tiles.build()
+    game.state_manager.keyboard.build()
+    phases.lap("board/keyboard build")
+
+    game.state_manager.transition_to("Play")
+    phases.lap("Play state")
+
+    game.redraw(dirty_regions.take(game.canvas.get_rect()))
+    phases.lap("first Play frame")
+    first_play_frame = phases.since_start()
+
+    phases.laps["font loads"] = phases.fonts / 1_000_000
+
+    return {
+        "phases": phases.laps,
+        "first_initial_frame": first_initial_frame,
+        "first_play_frame": first_play_frame,
+    }
+
+
+# -------------------------------------------------------------------------------------------------
+#   Run (parent process)
+#
+def run(mode: str, runs: int) -> list[dict]:
+    from src.image_cache import CacheDir
+
+    environment = {**os.environ, "SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"}
+    results = []
+
+    if mode == "warm":
+        runs += 1
+
+    for _ in range(runs):
+        if mode == "cold":
+            shutil.rmtree(CacheDir, ignore_errors=True)
+
+        started = perf_counter_ns()
+        child = subprocess.run(
+            [sys.executable, __file__, "--child", str(started)],
+            env=environment, capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+    #
+    #   The first warm launch only fills the caches
+    #
+    return results[1:] if mode == "warm" else results
+
+
+# -------------------------------------------------------------------------------------------------
+#   Summarize
+#
+def summarize(results: list[dict]) -> dict:
+    return {
+        "first_initial_frame": median(result["first_initial_frame"] for result in results),
+        "first_play_frame": median(result["first_play_frame"] for result in results),
+        "phases": {
+            phase: median(result["phases"][phase] for result in results)
+            for phase in results[0]["phases"]
+        },
+    }
+
+
+# -------------------------------------------------------------------------------------------------
+#   Report
+#
+def report(mode: str, summary: dict, previous: dict | None, threshold: float) -> str:
+    lines = [f"{mode} launch (median ms)"]
+
+    for phase, elapsed in summary["phases"].items():
+        lines.append(f"  {phase:<24}{elapsed:>9.2f}")
+
+    for total in ("first_initial_frame", "first_play_frame"):
+        line = f"  {total:<24}{summary[total]:>9.2f}"
+
+        if previous is not None and previous[total]:
+            change = summary[total] / previous[total] - 1
+            line += f"   {change:+.1%} vs previous"
+            if change > threshold:
+                line += "   REGRESSION"
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+# -------------------------------------------------------------------------------------------------
+#   Revision
+#
+def revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Time the game's startup from process start to the first frames")
+    parser.add_argument("--runs", type=int, default=5, help="launches per mode (default: %(default)s)")
+    parser.add_argument("--mode", choices=Modes, action="append", help="cold and/or warm (default: both)")
+    parser.add_argument("--history", default=History, help="JSON history file (default: %(default)s)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown against the previous entry reported as a regression (default: %(default)s)")
+    parser.add_argument("--child", type=int, help=SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child is not None:
+        print(json.dumps(launch(arguments.child)))
+        sys.exit()
+
+    try:
+        with open(arguments.history) as file:
+            history = json.load(file)
+    except FileNotFoundError:
+        history = []
+
+    entry = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": revision(),
+        "python": sys.version.split()[0],
+        "runs": arguments.runs,
+    }
+
+    for mode in arguments.mode or Modes:
+        summary = summarize(run(mode, arguments.runs))
+        previous = next((past[mode] for past in reversed(history) if mode in past), None)
+
+        print(report(mode, summary, previous, arguments.threshold))
+        entry[mode] = summary
+
+    history.append(entry)
+
+    with open(arguments.history, "w") as file:
+        json.dump(history, file, indent=2)
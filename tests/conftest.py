@@ -0,0 +1,20 @@
+import os
+from pathlib import Path
+
+import pytest
+
+# -------------------------------------------------------------------------------------------------
+#   No window, no audio device
+#
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+Root = Path(__file__).resolve().parent.parent
+
+
+# -------------------------------------------------------------------------------------------------
+#   The font and image paths in definitions.py are relative to the repository root
+#
+@pytest.fixture(autouse=True)
+def repository_root(monkeypatch):
+    monkeypatch.chdir(Root)
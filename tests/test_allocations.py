@@ -0,0 +1,80 @@
+import tracemalloc
+
+import pytest
+
+from src.board import Board
+from src.dirty_regions import dirty_regions
+from src.event_handler import GameKeypadMouseMotionHandler
+from src.keyboard import Keyboard
+
+
+# -------------------------------------------------------------------------------------------------
+#   Net Allocations
+#
+def net_allocations(action, repeat: int = 20) -> int:
+    """
+        Blocks still allocated after running <action> <repeat> times, counting only this
+        repository's code (tracemalloc's own bookkeeping and the test are left out)
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(repeat):
+            action()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    source = tracemalloc.Filter(True, "*/src/*")
+    return sum(
+        statistic.count_diff
+        for statistic in after.filter_traces([source]).compare_to(before.filter_traces([source]), "lineno")
+    )
+
+
+@pytest.fixture
+def frame():
+    """
+        Starts a fresh frame with real dirty-region marking (nothing marked yet).  The tests run
+        their action once as often as they measure it and take() in between, so the marks of
+        the measured runs fit in the slots the first runs left behind, as in a game where
+        every frame takes the marks of the one before
+    """
+    dirty_regions.mark_all()
+    dirty_regions.take((0, 0, 600, 750))
+    yield
+    dirty_regions.mark_all()
+
+
+def test_update_board_allocates_nothing(frame):
+    board = Board()
+    board.build()
+    flags = [1, 0, -1, 0, 1]
+
+    def guess():
+        board.row_index = 0
+        board.update_board(flags)
+
+    for _ in range(20):
+        guess()
+    dirty_regions.take((0, 0, 600, 750))
+
+    assert net_allocations(guess, 20) == 0
+
+
+def test_keypad_hover_allocates_nothing(frame):
+    keyboard = Keyboard()
+    keyboard.build()
+    keyboard.set_flags_and_letters([1, -1, 0, -1, 1], list("CLEAN"))
+    handler = GameKeypadMouseMotionHandler(keyboard)
+    positions = [key.rectangle.center for key in keyboard.keypad] + [(5, 5)]
+
+    def sweep():
+        for position in positions:
+            handler.handle_it(position)
+
+    for _ in range(3):
+        sweep()
+    dirty_regions.take((0, 0, 600, 750))
+
+    assert net_allocations(sweep, 3) == 0
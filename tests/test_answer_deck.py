@@ -0,0 +1,56 @@
+import pytest
+
+from src.answer_deck import AnswerDeck
+from src.board import Board
+from src.keyboard import Keyboard
+from src.word_manager import WordManager
+import src.wordle_words as words
+
+Words = ["crane", "slate", "adieu", "pious", "lymph"]
+
+
+def deal(deck: AnswerDeck, count: int) -> list[str]:
+    return [deck.draw() for _ in range(count)]
+
+
+def test_same_seed_same_answers():
+    assert deal(AnswerDeck(words.all_words, seed=7), 50) == deal(AnswerDeck(words.all_words, seed=7), 50)
+
+
+def test_every_pass_deals_every_word_once():
+    dealt = deal(AnswerDeck(Words, seed=3), 4 * len(Words))
+
+    for start in range(0, len(dealt), len(Words)):
+        assert sorted(dealt[start:start + len(Words)]) == sorted(Words)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_new_pass_does_not_repeat_the_last_word(seed):
+    dealt = deal(AnswerDeck(Words, seed=seed), 3 * len(Words))
+
+    assert all(dealt[index] != dealt[index + 1] for index in range(len(dealt) - 1))
+
+
+def test_single_word_deck_keeps_dealing():
+    assert deal(AnswerDeck(["crane"]), 3) == ["crane"] * 3
+
+
+def test_restore_carries_on_from_the_checkpoint():
+    deck = AnswerDeck(Words, seed=11)
+    deal(deck, 7)
+    checkpoint = deck.checkpoint()
+    expected = deal(deck, 8)
+
+    restored = AnswerDeck(Words)
+    restored.restore(checkpoint)
+
+    assert deal(restored, 8) == expected
+
+
+def test_word_manager_deals_from_the_given_deck():
+    word_manager = WordManager(Board(), Keyboard(), answer_deck=AnswerDeck(words.all_words, seed=5))
+    expected = AnswerDeck(words.all_words, seed=5)
+
+    for _ in range(3):
+        word_manager.engine.new_game()
+        assert word_manager.engine.answer == expected.draw().upper()
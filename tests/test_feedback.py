@@ -0,0 +1,68 @@
+from itertools import product
+from random import Random
+
+import pytest
+
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix, decode_pattern, encode_flags, score
+import src.wordle_words as words
+
+# -------------------------------------------------------------------------------------------------
+#   WordleEngine.get_flags without a feedback matrix is the original per-call algorithm, every
+#   faster scorer must agree with it
+#
+reference = WordleEngine().get_flags
+
+#
+#   Pairs with repeated letters in the guess, the answer or both
+#
+duplicate_pairs = [
+    ("speed", "abide"), ("abide", "speed"), ("geese", "eerie"), ("eerie", "geese"),
+    ("llama", "hello"), ("hello", "llama"), ("sassy", "asses"), ("asses", "sassy"),
+    ("kebab", "abbey"), ("abbey", "kebab"), ("robot", "boost"), ("boost", "robot"),
+    ("mamma", "maxim"), ("tweet", "sweet"), ("eerie", "there"), ("error", "robot"),
+    ("allee", "eagle"), ("sissy", "missy"), ("added", "dread"), ("steel", "lease"),
+]
+duplicate_words = sorted({word for pair in duplicate_pairs for word in pair})
+
+sample = Random(2024).sample(list(words.all_words), 80)
+
+
+def test_encode_decode_round_trip():
+    for flags in product((-1, 0, 1), repeat=5):
+        assert decode_pattern(encode_flags(list(flags))) == list(flags)
+
+
+@pytest.mark.parametrize("guess, answer", duplicate_pairs)
+def test_score_matches_reference_on_duplicate_letters(guess, answer):
+    assert decode_pattern(score(guess, answer)) == reference(guess, answer)
+
+
+def test_score_matches_reference_on_word_list_sample():
+    for guess, answer in product(sample, repeat=2):
+        assert decode_pattern(score(guess, answer)) == reference(guess, answer), (guess, answer)
+
+
+@pytest.mark.parametrize("word_list", [duplicate_words, sample], ids=["duplicates", "sample"])
+def test_matrix_get_flags_matches_reference(word_list):
+    matrix = FeedbackMatrix(word_list).build()
+
+    for guess, answer in product(word_list, repeat=2):
+        assert matrix.get_flags(guess, answer) == reference(guess, answer), (guess, answer)
+
+
+def test_matrix_get_flags_unknown_word():
+    matrix = FeedbackMatrix(duplicate_words).build()
+
+    assert matrix.get_flags("zzzzz", "geese") is None
+
+
+@pytest.mark.parametrize("word_list", [duplicate_words, sample], ids=["duplicates", "sample"])
+def test_batch_scorer_matches_reference(word_list):
+    pytest.importorskip("numpy")
+    from src.batch_scorer import encode_words, score_matrix
+
+    patterns = score_matrix(encode_words(word_list), rows_per_chunk=7)
+
+    for (row, guess), (column, answer) in product(enumerate(word_list), repeat=2):
+        assert decode_pattern(int(patterns[row, column])) == reference(guess, answer), (guess, answer)
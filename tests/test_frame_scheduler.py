@@ -0,0 +1,34 @@
+from time import perf_counter
+
+import pygame as pg
+import pytest
+
+from src.dirty_regions import dirty_regions
+from src.frame_scheduler import FrameScheduler
+
+
+#
+#   Posted after two seconds so a wait that blocks for input fails the test instead of hanging
+#
+Watchdog = pg.USEREVENT + 1
+
+
+@pytest.fixture
+def idle():
+    pg.init()
+    pg.display.set_mode((1, 1))
+    pg.event.clear()
+    dirty_regions.take(pg.Rect(0, 0, 1, 1))
+    pg.time.set_timer(Watchdog, 2000, loops=1)
+    yield
+    pg.time.set_timer(Watchdog, 0)
+    dirty_regions.mark_all()
+
+
+@pytest.mark.parametrize("max_latency", [0, -5, 1])
+def test_wait_returns_without_input(idle, max_latency):
+    scheduler = FrameScheduler(max_latency=max_latency)
+
+    start = perf_counter()
+    assert scheduler.wait() == []
+    assert perf_counter() - start < 0.5
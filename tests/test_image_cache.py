@@ -0,0 +1,24 @@
+import os
+
+import src.assets.definitions as df
+from src.image_cache import CacheDir, ImageCache
+
+from conftest import Root
+
+
+def test_cache_is_written_next_to_the_sources(tmp_path, monkeypatch):
+    logo = str(Root / df.splash_screen_logo)
+    size = (7, 9)
+    before = set(os.listdir(CacheDir)) if os.path.isdir(CacheDir) else set()
+    monkeypatch.chdir(tmp_path)
+
+    try:
+        assert ImageCache.get(logo, size).get_size() == size
+        written = set(os.listdir(CacheDir)) - before
+
+        assert [name for name in written if name.endswith("-7x9.bin")]
+        assert not os.listdir(tmp_path)
+    finally:
+        ImageCache.images = {key: image for key, image in ImageCache.images.items() if key[1] != size}
+        for name in set(os.listdir(CacheDir)) - before:
+            os.remove(os.path.join(CacheDir, name))
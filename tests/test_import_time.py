@@ -0,0 +1,43 @@
+import re
+import subprocess
+import sys
+
+import src.assets.definitions as df
+
+from conftest import Root
+
+#
+#   import time: <self us> | <cumulative us> | <module, indented by nesting depth>
+#
+ImportLine = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+
+# -------------------------------------------------------------------------------------------------
+#   Import Time
+#
+def import_time(module: str) -> float:
+    """
+        Milliseconds spent importing, in a fresh interpreter, everything <module> needs: the
+        cumulative times of the top level imports reported by -X importtime added up
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Root, capture_output=True, text=True, check=True
+    )
+
+    total = 0
+    for line in result.stderr.splitlines():
+        match = ImportLine.match(line)
+        if match:
+            total += int(match.group(1))
+
+    return total / 1000
+
+
+def test_state_manager_import_time_within_budget():
+    #
+    #   Best of three, the first run also pays for cold disk caches and .pyc compilation
+    #
+    elapsed = min(import_time("src.state_manager") for _ in range(3))
+
+    assert elapsed <= df.ImportTimeBudget, f"importing src.state_manager took {elapsed:.1f} ms"
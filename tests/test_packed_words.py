@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+from src.packed_words import PackedWords
+import src.wordle_words as words
+
+from conftest import Root
+
+
+def test_word_list_loads_outside_the_repository(tmp_path):
+    environment = {**os.environ, "PYTHONPATH": str(Root)}
+    result = subprocess.run(
+        [sys.executable, "-c", "import src.wordle_words as words; print(len(words.all_words))"],
+        cwd=tmp_path, env=environment, capture_output=True, text=True, check=True
+    )
+
+    assert int(result.stdout) == len(words.all_words)
+
+
+def test_index_matches_the_list():
+    plain = list(words.all_words)
+
+    for index in range(0, len(plain), 37):
+        assert words.all_words.index(plain[index]) == plain.index(plain[index])
+        assert plain[index] in words.all_words
+        assert plain[index].upper() in words.all_words
+
+
+@pytest.mark.parametrize("word", ["zzzzz", "abcd", "abcdef", "ab1de", 12345, None])
+def test_not_a_word(word):
+    assert word not in words.all_words
+
+    with pytest.raises(ValueError):
+        words.all_words.index(word)
+
+
+def test_duplicates_keep_the_first_index():
+    packed = PackedWords(array("I", map(PackedWords.encode, ["crane", "slate", "crane", "adieu"])))
+
+    assert packed.index("crane") == 0
+    assert packed.index("crane", 1) == 2
+    assert packed.index("adieu") == 3
@@ -0,0 +1,22 @@
+import pytest
+
+import src.simulator as simulator
+from src.feedback import FeedbackMatrix
+from src.solver import EntropySolver
+import src.wordle_words as words
+
+
+def test_entropy_workers_use_the_book_they_are_given(monkeypatch):
+    book = EntropySolver(FeedbackMatrix.load(words.all_words)).opening_book()
+
+    def rebuilt(*_):
+        pytest.fail("worker worked out the opening book again")
+
+    monkeypatch.setattr(EntropySolver, "read_book", rebuilt)
+    monkeypatch.setattr(EntropySolver, "build_book", rebuilt)
+
+    simulator._start_worker("entropy", False, {"book": book})
+    histogram = simulator._play_games([words.all_words[0], words.all_words[100]])
+
+    assert sum(histogram.values()) == 2
+    assert histogram[simulator.Lost] == 0
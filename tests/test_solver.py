@@ -0,0 +1,111 @@
+from array import array
+from random import Random
+
+import pytest
+
+from src.answer_deck import AnswerDeck
+from src.engine import WordleEngine
+from src.feedback import FeedbackMatrix
+from src.packed_words import PackedWords
+import src.solver as solver_module
+from src.solver import EntropySolver
+import src.wordle_words as words
+
+#
+#   A word list small enough to build its feedback table in the test, large enough that the
+#   full list takes several scoring chunks and has more candidates than feedback patterns
+#
+word_list = PackedWords(array("I", map(PackedWords.encode, Random(7).sample(list(words.all_words), 400))))
+matrix = FeedbackMatrix(word_list).build()
+
+
+def play_hints(engine: WordleEngine, solver: EntropySolver) -> list[str]:
+    while not engine.game_over:
+        engine.play(solver.hint(engine))
+
+    return engine.guesses
+
+
+def test_hint_starts_over_for_a_new_game():
+    engine = WordleEngine(AnswerDeck(word_list, seed=1), matrix, word_list)
+    solver = EntropySolver(matrix, book_path=None)
+
+    engine.new_game(word_list[0])
+    engine.play(word_list[1])
+    engine.play(word_list[2])
+    solver.hint(engine)
+    #
+    #   More guesses into the next game than the solver applied in the last one
+    #
+    engine.new_game(word_list[3])
+    for word in word_list[4:7]:
+        engine.play(word)
+
+    fresh = EntropySolver(matrix, book_path=None)
+
+    assert solver.hint(engine) == fresh.hint(engine)
+    assert solver.candidates == fresh.candidates
+
+
+def test_hint_starts_over_for_another_engine():
+    solver = EntropySolver(matrix, book_path=None)
+    first = WordleEngine(AnswerDeck(word_list), matrix, word_list)
+    first.new_game(word_list[10])
+    play_hints(first, solver)
+
+    second = WordleEngine(AnswerDeck(word_list), matrix, word_list)
+    second.new_game(word_list[20])
+    same = WordleEngine(AnswerDeck(word_list), matrix, word_list)
+    same.new_game(word_list[20])
+
+    assert play_hints(second, solver) == play_hints(same, EntropySolver(matrix, book_path=None))
+
+
+def test_opening_book_round_trip(tmp_path, monkeypatch):
+    path = str(tmp_path / "opening.bin")
+    written = EntropySolver(matrix, book_path=path).opening_book()
+
+    reader = EntropySolver(matrix, book_path=path)
+    monkeypatch.setattr(reader, "build_book", lambda: pytest.fail("book was rebuilt"))
+
+    assert reader.opening_book() == written
+
+
+def test_opening_book_from_another_word_list_is_rebuilt(tmp_path):
+    path = str(tmp_path / "opening.bin")
+    EntropySolver(matrix, book_path=path).opening_book()
+
+    other = FeedbackMatrix(PackedWords(word_list.codes[:300])).build()
+
+    assert EntropySolver(other, book_path=None).read_book(path) is None
+
+
+def test_book_guesses_match_scoring():
+    """
+        The first two guesses taken from the book are the ones scoring would have chosen
+    """
+    engine = WordleEngine(AnswerDeck(word_list, seed=4), matrix, word_list)
+    solver = EntropySolver(matrix, book_path=None)
+
+    for _ in range(20):
+        engine.new_game()
+        opening = solver.hint(engine)
+        engine.play(opening)
+        second = solver.hint(engine)
+
+        scoring = EntropySolver(matrix, book_path=None)
+        assert scoring.best_guess() == opening
+        scoring.update(opening, engine.feedback[0])
+        assert scoring.next_guess() == second
+
+
+@pytest.mark.parametrize("size", [3, 40, 242, 243, 400])
+def test_numpy_scores_match_counting(size, monkeypatch):
+    pytest.importorskip("numpy")
+    solver = EntropySolver(matrix, book_path=None)
+    solver.candidates = array("I", sorted(Random(size).sample(range(matrix.size), size)))
+
+    scores = solver.expected_information().tolist()
+    monkeypatch.setattr(solver_module, "numpy", None)
+
+    assert scores == pytest.approx(solver.expected_information(), abs=1e-9)
@@ -0,0 +1,38 @@
+import pygame as pg
+
+from src.event_handler import NavButtonMouseUpHandler
+from src.event_manager import EventManager
+from src.game import Game
+
+
+def test_two_handlers_of_one_class_both_subscribe():
+    event_manager = EventManager()
+    event_manager.register_events()
+    first, second = NavButtonMouseUpHandler(None), NavButtonMouseUpHandler(None)
+
+    assert event_manager.subscribe(pg.MOUSEBUTTONUP, first)
+    assert event_manager.subscribe(pg.MOUSEBUTTONUP, second)
+    assert not event_manager.subscribe(pg.MOUSEBUTTONUP, first)
+    assert event_manager.listeners[pg.MOUSEBUTTONUP] == (first, second)
+
+
+def test_start_again_reuses_its_handlers(monkeypatch):
+    game = Game()
+    game.initialize()
+    state_manager, event_manager = game.state_manager, game.event_manager
+
+    created = []
+    create_handlers = state_manager.create_handlers
+    monkeypatch.setattr(state_manager, "create_handlers", lambda name: created.append(name) or create_handlers(name))
+
+    state_manager.transition_to("Play")
+    state_manager.transition_to("Start")
+    listeners = dict(event_manager.listeners)
+    subscriptions = list(event_manager.scopes["Play"])
+
+    for action in ("New", "Start", "Start"):
+        state_manager.transition_to(action)
+
+    assert event_manager.listeners == listeners
+    assert event_manager.scopes["Play"] == subscriptions
+    assert created == ["Play", "Start"]